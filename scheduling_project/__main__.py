@@ -0,0 +1,16 @@
+"""
+Command-line entry point: python -m scheduling_project run --algo ...
+Without arguments the PyQt6 GUI is started instead
+"""
+import os
+import sys
+
+# Modules import each other as top-level packages (algorithms, engine, ...)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        from cli import main
+        sys.exit(main())
+    from gui.main_window import main
+    main()
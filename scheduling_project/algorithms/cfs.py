@@ -0,0 +1,97 @@
+# Completely Fair Scheduler (CFS) style algorithm
+
+import heapq
+
+# Load weight per nice value -20..19 (the Linux table: each nice step
+# changes CPU share by about 10%)
+NICE_TO_WEIGHT = [
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+]
+NICE_0_WEIGHT = 1024
+VRUNTIME_SHIFT = 16  # fixed-point fraction bits, keeps vruntime exact
+
+
+def nice_to_weight(nice):
+    if not -20 <= nice <= 19:
+        raise ValueError("Nice value must be between -20 and 19")
+    return NICE_TO_WEIGHT[nice + 20]
+
+
+def cfs(processes, target_latency=6, min_granularity=1, stats=None):
+    """
+    Fair scheduling by virtual runtime
+    processes = [(name, arrival, burst)] or [(name, arrival, burst, nice)]
+    target_latency = time in which every runnable process should get a turn
+    min_granularity = shortest slice; with many runnable processes the
+                      period stretches to n * min_granularity instead
+    stats = optional engine.instrument.RunStats
+    The process with the smallest vruntime runs for a slice proportional
+    to its weight; vruntime then grows by the run time scaled by
+    NICE_0_WEIGHT / weight. New arrivals start at the current minimum
+    vruntime. Runnable processes sit in a heap keyed by (vruntime,
+    arrival order): O(log n) pick and reinsert.
+    Returns: schedule list of process names per time unit ("Idle" when free)
+    """
+    if target_latency <= 0 or min_granularity <= 0:
+        raise ValueError("Target latency and minimum granularity must be positive")
+    processes = sorted(processes, key=lambda x: x[1])
+    n = len(processes)
+    remaining = {p[0]: p[2] for p in processes}
+    weight = {p[0]: nice_to_weight(p[3] if len(p) > 3 else 0) for p in processes}
+    # Integer vruntime increment per time unit for each process
+    step = {name: (NICE_0_WEIGHT << VRUNTIME_SHIFT) // w for name, w in weight.items()}
+    latency_tasks = max(target_latency // min_granularity, 1)
+
+    time, schedule = 0, []
+    runnable = []  # heap of (vruntime, seq, name)
+    total_weight = 0
+    min_vruntime = 0
+    i = 0
+
+    while i < n or runnable:
+        while i < n and processes[i][1] <= time:
+            name = processes[i][0]
+            heapq.heappush(runnable, (min_vruntime, i, name))
+            total_weight += weight[name]
+            if stats is not None:
+                stats.enqueue(time, name)
+            i += 1
+        if not runnable:
+            # CPU idle until the next process arrives
+            gap = processes[i][1] - time
+            schedule.extend(["Idle"] * gap)
+            if stats is not None:
+                stats.idle(time, gap)
+            time += gap
+            continue
+
+        vruntime, seq, name = runnable[0]
+        nr = len(runnable)
+        period = target_latency if nr <= latency_tasks else nr * min_granularity
+        slice_len = max(period * weight[name] // total_weight, min_granularity)
+        run_time = min(slice_len, remaining[name])
+        if stats is not None:
+            stats.dequeue(time, name)
+            stats.dispatch(time, name, run_time)
+        schedule.extend([name] * run_time)
+        time += run_time
+        remaining[name] -= run_time
+        vruntime += run_time * step[name]
+
+        if remaining[name] > 0:
+            heapq.heapreplace(runnable, (vruntime, seq, name))
+            if stats is not None:
+                stats.enqueue(time, name)
+        else:
+            heapq.heappop(runnable)
+            total_weight -= weight[name]
+        if runnable:
+            min_vruntime = max(min_vruntime, runnable[0][0])
+    return schedule
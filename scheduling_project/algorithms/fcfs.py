@@ -1,7 +1,8 @@
-def fcfs(processes):
+def fcfs(processes, stats=None):
     """
     First Come First Serve Scheduling
     processes = [(name, arrival, burst)]
+    stats = optional engine.instrument.RunStats
     Returns: schedule list of process names per time unit
     """
     schedule = []
@@ -10,7 +11,11 @@ def fcfs(processes):
         if time < at:
             # CPU idle until process arrives
             schedule.extend(["Idle"] * (at - time))
+            if stats is not None:
+                stats.idle(time, at - time)
             time = at
         schedule.extend([name] * bt)
+        if stats is not None:
+            stats.dispatch(time, name, bt)
         time += bt
     return schedule
@@ -1,11 +1,16 @@
 # Priority scheduling algorithm
 
-def priority_scheduling(processes):
+def priority_scheduling(processes, stats=None):
     """
     Non-preemptive Priority Scheduling
     processes = [(name, arrival, burst, priority)]
     Lower priority number = higher priority
+    stats = optional engine.instrument.RunStats
+    Returns: schedule list of process names per time unit ("Idle" when free)
     """
+    if any(len(p) < 4 for p in processes):
+        raise ValueError("Priority scheduling needs a priority column: "
+                         "(name, arrival, burst, priority)")
     processes = sorted(processes, key=lambda x: (x[1], x[3]))
     schedule, time = [], 0
     ready = []
@@ -15,12 +20,23 @@ def priority_scheduling(processes):
     while i < n or ready:
         while i < n and processes[i][1] <= time:
             ready.append(processes[i])
+            if stats is not None:
+                stats.enqueue(time, processes[i][0])
             i += 1
         if ready:
             ready.sort(key=lambda x: x[3])  # pick highest priority
             name, at, bt, pr = ready.pop(0)
+            if stats is not None:
+                stats.sort(time, len(ready) + 1)
+                stats.dequeue(time, name)
+                stats.dispatch(time, name, bt)
             schedule.extend([name] * bt)
             time += bt
         else:
-            time += 1
+            # CPU idle until the next process arrives
+            gap = processes[i][1] - time
+            schedule.extend(["Idle"] * gap)
+            if stats is not None:
+                stats.idle(time, gap)
+            time += gap
     return schedule
@@ -0,0 +1,176 @@
+# Real-time scheduling of periodic tasks: EDF and rate monotonic
+
+import heapq
+from math import gcd
+
+
+def normalize_tasks(tasks):
+    """
+    tasks = [(name, period, wcet)] or [(name, period, wcet, deadline)]
+    Relative deadline defaults to the period; all tasks release at time 0
+    Returns: [(name, period, wcet, deadline)]
+    """
+    result = []
+    for task in tasks:
+        name, period, wcet = task[0], task[1], task[2]
+        deadline = task[3] if len(task) > 3 else period
+        if period <= 0 or wcet <= 0 or deadline <= 0:
+            raise ValueError("Period, execution time and deadline must be positive")
+        result.append((name, period, wcet, deadline))
+    return result
+
+
+def hyperperiod(tasks):
+    """Least common multiple of the task periods"""
+    h = 1
+    for task in tasks:
+        h = h * task[1] // gcd(h, task[1])
+    return h
+
+
+def _simulate(tasks, policy, until, misses, stats):
+    """
+    Event-driven run over [0, until): time jumps from release to
+    completion, never tick by tick. Ready jobs sit in a heap keyed by
+    absolute deadline (EDF) or period (rate monotonic).
+    Yields: (name, start, end) with Idle gaps; returns True when no job
+    is left at until (the state at a hyperperiod boundary is then the
+    same as at time 0)
+    """
+    edf = policy == "edf"
+    releases = [(0, i) for i in range(len(tasks))]  # heap of (time, task)
+    ready = []  # heap of [key, task, release, remaining, deadline]
+    t = 0
+    while t < until:
+        while releases[0][0] <= t:
+            release, i = heapq.heappop(releases)
+            name, period, wcet, deadline = tasks[i]
+            key = release + deadline if edf else period
+            heapq.heappush(ready, [key, i, release, wcet, release + deadline])
+            heapq.heappush(releases, (release + period, i))
+            if stats is not None:
+                stats.enqueue(release, name)
+        next_release = min(releases[0][0], until)
+
+        if not ready:
+            if stats is not None:
+                stats.idle(t, next_release - t)
+            yield ("Idle", t, next_release)
+            t = next_release
+            continue
+
+        job = ready[0]
+        name = tasks[job[1]][0]
+        end = min(t + job[3], next_release)
+        if stats is not None:
+            stats.dispatch(t, name, end - t)
+        yield (name, t, end)
+        job[3] -= end - t
+        t = end
+        if job[3] == 0:
+            heapq.heappop(ready)
+            if stats is not None:
+                stats.dequeue(t, name)
+            if misses is not None and t > job[4]:
+                misses.append((name, job[2], job[4], t))
+
+    if misses is not None:
+        # Jobs still pending whose deadline has already passed
+        for _, i, release, _, deadline in sorted(ready, key=lambda j: j[4]):
+            if deadline < until:
+                misses.append((tasks[i][0], release, deadline, None))
+    return not ready
+
+
+def _merged(segments):
+    last = None
+    for seg in segments:
+        if last is not None and last[0] == seg[0] and last[2] == seg[1]:
+            last = (last[0], last[1], seg[2])
+            continue
+        if last is not None:
+            yield last
+        last = seg
+    if last is not None:
+        yield last
+
+
+def iter_periodic_segments(tasks, policy="edf", horizon=None, misses=None, stats=None):
+    """
+    (name, start, end) segments of a periodic task set over [0, horizon)
+    policy = "edf" or "rm" (rate monotonic: shorter period first)
+    horizon = defaults to one hyperperiod
+    misses = optional list, receives (name, release, deadline, finish) for
+             every late job (finish is None if unfinished at horizon)
+    Once the first hyperperiod ends with no pending job the schedule
+    repeats, so later hyperperiods are copied instead of simulated.
+    stats = optional engine.instrument.RunStats; forces a full simulation
+    """
+    if policy not in ("edf", "rm"):
+        raise ValueError(f"Unknown policy: {policy}")
+    tasks = normalize_tasks(tasks)
+    if not tasks:
+        return
+    h = hyperperiod(tasks)
+    if horizon is None:
+        horizon = h
+    if horizon <= h or stats is not None:
+        yield from _merged(_simulate(tasks, policy, horizon, misses, stats))
+        return
+
+    first_misses = [] if misses is not None else None
+    first, run = [], _simulate(tasks, policy, h, first_misses, None)
+    while True:
+        try:
+            first.append(next(run))
+        except StopIteration as done:
+            clean = done.value
+            break
+    if not clean:
+        # Backlog carries into the next hyperperiod: no repetition
+        yield from _merged(_simulate(tasks, policy, horizon, misses, None))
+        return
+
+    def tiled():
+        offset = 0
+        while offset < horizon:
+            if misses is not None:
+                misses.extend((name, release + offset, deadline + offset, finish + offset)
+                              for name, release, deadline, finish in first_misses
+                              if deadline + offset < horizon)
+            for name, start, end in first:
+                if offset + start >= horizon:
+                    return
+                yield (name, offset + start, min(offset + end, horizon))
+            offset += h
+    yield from _merged(tiled())
+
+
+def _schedule(tasks, policy, horizon, stats):
+    schedule = []
+    for name, start, end in iter_periodic_segments(tasks, policy, horizon, stats=stats):
+        schedule.extend([name] * (end - start))
+    return schedule
+
+
+def edf(tasks, horizon=None, stats=None):
+    """
+    Preemptive Earliest Deadline First for periodic tasks
+    tasks = [(name, period, wcet[, deadline])]
+    horizon = schedule length (default: one hyperperiod)
+    stats = optional engine.instrument.RunStats
+    Returns: schedule list of task names per time unit ("Idle" when free)
+    """
+    return _schedule(tasks, "edf", horizon, stats)
+
+
+def rate_monotonic(tasks, horizon=None, stats=None):
+    """
+    Preemptive rate-monotonic scheduling for periodic tasks
+    Shorter period = higher priority; ties go to the earlier task
+    tasks = [(name, period, wcet[, deadline])]
+    horizon = schedule length (default: one hyperperiod)
+    stats = optional engine.instrument.RunStats
+    Returns: schedule list of task names per time unit ("Idle" when free)
+    """
+    return _schedule(tasks, "rm", horizon, stats)
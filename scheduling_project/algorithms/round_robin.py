@@ -2,10 +2,12 @@
 
 from collections import deque
 
-def round_robin(processes, quantum=2):
+def round_robin(processes, quantum=2, stats=None):
     """
     Round Robin Scheduling
     processes = [(name, arrival, burst)]
+    stats = optional engine.instrument.RunStats
+    Returns: schedule list of process names per time unit ("Idle" when free)
     """
     time, schedule = 0, []
     processes = sorted(processes, key=lambda x: x[1])
@@ -16,18 +18,32 @@ def round_robin(processes, quantum=2):
     while i < n or queue:
         while i < n and processes[i][1] <= time:
             queue.append(processes[i][0])
+            if stats is not None:
+                stats.enqueue(time, processes[i][0])
             i += 1
         if queue:
             name = queue.popleft()
             run_time = min(quantum, remaining[name])
+            if stats is not None:
+                stats.dequeue(time, name)
+                stats.dispatch(time, name, run_time)
             schedule.extend([name] * run_time)
             time += run_time
             remaining[name] -= run_time
             while i < n and processes[i][1] <= time:
                 queue.append(processes[i][0])
+                if stats is not None:
+                    stats.enqueue(time, processes[i][0])
                 i += 1
             if remaining[name] > 0:
                 queue.append(name)
+                if stats is not None:
+                    stats.enqueue(time, name)
         else:
-            time += 1
+            # CPU idle until the next process arrives
+            gap = processes[i][1] - time
+            schedule.extend(["Idle"] * gap)
+            if stats is not None:
+                stats.idle(time, gap)
+            time += gap
     return schedule
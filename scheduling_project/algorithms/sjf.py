@@ -1,8 +1,10 @@
 # Shortest Job First (SJF) scheduling algorithm
 
-def sjf(processes):
+def sjf(processes, stats=None):
     """
     Shortest Job First (Non-preemptive)
+    stats = optional engine.instrument.RunStats
+    Returns: schedule list of process names per time unit ("Idle" when free)
     """
     processes = sorted(processes, key=lambda x: (x[1], x[2]))  # sort by arrival, then burst
     schedule, time = [], 0
@@ -13,12 +15,23 @@ def sjf(processes):
     while i < n or ready:
         while i < n and processes[i][1] <= time:
             ready.append(processes[i])
+            if stats is not None:
+                stats.enqueue(time, processes[i][0])
             i += 1
         if ready:
             ready.sort(key=lambda x: x[2])  # pick shortest burst
             name, at, bt = ready.pop(0)
+            if stats is not None:
+                stats.sort(time, len(ready) + 1)
+                stats.dequeue(time, name)
+                stats.dispatch(time, name, bt)
             schedule.extend([name] * bt)
             time += bt
         else:
-            time += 1
+            # CPU idle until the next process arrives
+            gap = processes[i][1] - time
+            schedule.extend(["Idle"] * gap)
+            if stats is not None:
+                stats.idle(time, gap)
+            time += gap
     return schedule
@@ -1,8 +1,10 @@
 # Shortest Remaining Time First (SRTF) scheduling algorithm
 
-def srtf(processes):
+def srtf(processes, stats=None):
     """
     Shortest Remaining Time First (Preemptive SJF)
+    stats = optional engine.instrument.RunStats
+    Returns: schedule list of process names per time unit ("Idle" when free)
     """
     schedule, time = [], 0
     processes = sorted(processes, key=lambda x: x[1])  # sort by arrival
@@ -13,15 +15,27 @@ def srtf(processes):
     while i < n or ready:
         while i < n and processes[i][1] <= time:
             ready.append(processes[i])
+            if stats is not None:
+                stats.enqueue(time, processes[i][0])
             i += 1
         if ready:
             ready.sort(key=lambda x: remaining[x[0]])
             name, at, bt = ready[0]
             schedule.append(name)
             remaining[name] -= 1
+            if stats is not None:
+                stats.sort(time, len(ready))
+                stats.dispatch(time, name, 1)
             if remaining[name] == 0:
                 ready.pop(0)
+                if stats is not None:
+                    stats.dequeue(time, name)
             time += 1
         else:
-            time += 1
+            # CPU idle until the next process arrives
+            gap = processes[i][1] - time
+            schedule.extend(["Idle"] * gap)
+            if stats is not None:
+                stats.idle(time, gap)
+            time += gap
     return schedule
@@ -0,0 +1 @@
+# Analysis package for scheduling metrics and statistics
\ No newline at end of file
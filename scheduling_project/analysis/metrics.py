@@ -0,0 +1,52 @@
+# Per-process scheduling metrics computed from a schedule
+
+def iter_segments(schedule):
+    """
+    Collapse a per-time-unit schedule into runs
+    Yields: (name, start, end) with end exclusive
+    """
+    start, current = 0, None
+    for t, name in enumerate(schedule):
+        if name != current:
+            if current is not None:
+                yield (current, start, t)
+            start, current = t, name
+    if current is not None:
+        yield (current, start, len(schedule))
+
+
+def compute_metrics(schedule, processes):
+    """
+    Compute CT, TAT, WT and RT for every process in a schedule
+    schedule = list of process names per time unit
+    processes = [(name, arrival, burst, ...)]
+    Returns: {"processes": {name: {...}}, "avg_tat": x, "avg_wt": y, "avg_rt": z}
+    """
+    first_run, completion = {}, {}
+    for t, name in enumerate(schedule):
+        if name not in first_run:
+            first_run[name] = t
+        completion[name] = t + 1
+
+    per_process = {}
+    total_tat = total_wt = total_rt = 0
+    for p in processes:
+        name, at, bt = p[0], p[1], p[2]
+        if name not in completion:
+            continue
+        ct = completion[name]
+        tat = ct - at
+        wt = tat - bt
+        rt = first_run[name] - at
+        per_process[name] = {"ct": ct, "tat": tat, "wt": wt, "rt": rt}
+        total_tat += tat
+        total_wt += wt
+        total_rt += rt
+
+    done = len(per_process)
+    return {
+        "processes": per_process,
+        "avg_tat": total_tat / done if done else 0.0,
+        "avg_wt": total_wt / done if done else 0.0,
+        "avg_rt": total_rt / done if done else 0.0,
+    }
@@ -0,0 +1,218 @@
+# Seeded, parallel Monte Carlo comparison of scheduling policies
+
+import math
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+
+from analysis.streaming import RunningStat
+from engine.des import POLICIES, simulate
+
+METRICS = ("mean_wt", "tail_wt")
+
+# label = shown in results, policy = name in engine.des.POLICIES
+Candidate = namedtuple("Candidate", ["label", "policy", "quantum"])
+
+# replications = number of workloads simulated
+# settled = True if the ranking was settled before max_replications
+# ranking = {metric: [labels, best (lowest) first]}
+# estimates = {label: {metric: (mean, low, high)}}
+# differences = {(a, b): {metric: (mean, low, high)}} of a - b over
+#               consecutive labels in each metric's ranking
+ComparisonResult = namedtuple(
+    "ComparisonResult", ["replications", "settled", "ranking", "estimates", "differences"]
+)
+
+
+def parse_candidate(candidate):
+    """
+    "sjf", "round_robin:4" or a (label, policy, quantum) tuple -> Candidate
+    """
+    if isinstance(candidate, Candidate):
+        return candidate
+    if isinstance(candidate, (tuple, list)):
+        return Candidate(*candidate)
+    policy, _, quantum = candidate.partition(":")
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy}")
+    if quantum and policy != "round_robin":
+        raise ValueError("Only round_robin takes a quantum")
+    return Candidate(candidate, policy, int(quantum) if quantum else 2)
+
+
+def _sample(rng, dist, size):
+    """Draw size values from a ["name", params...] distribution spec"""
+    name, *args = dist
+    if name == "constant":
+        return np.full(size, float(args[0]))
+    if name == "uniform":
+        return rng.integers(args[0], args[1] + 1, size).astype(float)
+    if name == "exponential":
+        return rng.exponential(args[0], size)
+    if name == "lognormal":
+        return rng.lognormal(args[0], args[1], size)
+    if name == "normal":
+        return rng.normal(args[0], args[1], size)
+    if name == "poisson":
+        return rng.poisson(args[0], size).astype(float)
+    raise ValueError(f"Unknown distribution: {name}")
+
+
+def generate_workload(spec, seed, index):
+    """
+    Workload number index of a seeded family
+    spec = {"processes": n or [min, max],
+            "interarrival": ["exponential", 4.0],
+            "burst": ["uniform", 1, 10],
+            "priority": ["uniform", 1, 5]}       (priority is optional)
+    Distributions: constant, uniform (integers), exponential, lognormal,
+    normal, poisson. The stream depends only on (seed, index), so any
+    worker can draw any workload and get the same one.
+    Returns: [(name, arrival, burst)] or [(name, arrival, burst, priority)]
+    """
+    rng = np.random.default_rng([seed, index])
+    count = spec["processes"]
+    n = int(rng.integers(count[0], count[1] + 1)) if isinstance(count, (list, tuple)) else count
+    gaps = np.maximum(np.rint(_sample(rng, spec["interarrival"], n)), 0).astype(np.int64)
+    arrival = np.cumsum(gaps) - gaps[0] if n else gaps
+    burst = np.maximum(np.rint(_sample(rng, spec["burst"], n)), 1).astype(np.int64)
+    names = [f"P{i + 1}" for i in range(n)]
+    if "priority" in spec:
+        priority = np.rint(_sample(rng, spec["priority"], n)).astype(np.int64)
+        return list(zip(names, arrival.tolist(), burst.tolist(), priority.tolist()))
+    return list(zip(names, arrival.tolist(), burst.tolist()))
+
+
+def _tail(values, q):
+    """Nearest-rank q-quantile"""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q * len(ordered)) - 1, 0)] if ordered else 0.0
+
+
+def _replicate(job):
+    """Worker: every candidate on one workload (common random numbers)"""
+    spec, seed, index, candidates, tail = job
+    workload = generate_workload(spec, seed, index)
+    results = []
+    for candidate in candidates:
+        metrics = simulate(workload, candidate.policy, quantum=candidate.quantum,
+                           record=False).metrics
+        waits = [m["wt"] for m in metrics["processes"].values()]
+        results.append((metrics["avg_wt"], _tail(waits, tail)))
+    return results
+
+
+def _interval(stat, z):
+    half = z * stat.std / math.sqrt(stat.count) if stat.count > 1 else math.inf
+    return (stat.mean, stat.mean - half, stat.mean + half)
+
+
+def _looks(min_replications, max_replications, batch_size):
+    """Number of batch boundaries at which the stop rule can be checked"""
+    ends = {min(b * batch_size, max_replications)
+            for b in range(1, math.ceil(max_replications / batch_size) + 1)}
+    return max(sum(1 for n in ends if n >= min_replications), 1)
+
+
+def compare(spec, candidates, seed=0, workers=None, confidence=0.95, tolerance=0.0,
+            min_replications=20, max_replications=2000, batch_size=20, tail=0.95,
+            metrics=METRICS):
+    """
+    Compare policies on random workloads until the ranking is settled
+    candidates = e.g. ["sjf", "srtf", "round_robin:2", "round_robin:4"]
+    Every replication runs all candidates on the same seeded workload, so
+    differences are paired. Per metric (mean_wt = average waiting time,
+    tail_wt = its tail quantile per workload), candidates are ranked by
+    mean and the confidence interval of each consecutive difference is
+    tracked. The run stops once every interval excludes 0, or lies within
+    +-tolerance (a tie).
+    Replications run in batches of batch_size and the stop rule is only
+    checked between batches, so the result does not depend on workers.
+    Intervals are Bonferroni-adjusted over every pair, metric and possible
+    look (batch boundary from min_replications on), so stopping at the
+    first settled look still holds the joint confidence level; fewer,
+    larger batches give tighter intervals.
+    Returns: ComparisonResult
+    """
+    candidates = [parse_candidate(c) for c in candidates]
+    if len(candidates) < 2:
+        raise ValueError("Need at least two candidates to compare")
+    labels = [c.label for c in candidates]
+    if len(set(labels)) != len(labels):
+        raise ValueError("Candidate labels must be unique")
+    unknown = set(metrics) - set(METRICS)
+    if unknown:
+        raise ValueError(f"Unknown metric: {sorted(unknown)[0]}")
+    columns = [METRICS.index(m) for m in metrics]
+    k = len(candidates)
+
+    # Adjacent pairs are picked from the data, so cover all pairs
+    tests = k * (k - 1) // 2 * len(metrics)
+    looks = _looks(min_replications, max_replications, batch_size)
+    alpha = 1 - confidence
+    z = NormalDist().inv_cdf(1 - alpha / (2 * tests * looks))
+    # Per candidate and per unordered pair (a before b in labels), one
+    # RunningStat per metric; b - a is the negated a - b
+    single = {label: [RunningStat() for _ in metrics] for label in labels}
+    paired = {(a, b): [RunningStat() for _ in metrics]
+              for i, a in enumerate(labels) for b in labels[i + 1:]}
+
+    def difference(a, b, m):
+        """Interval of a - b for metric m"""
+        if (a, b) in paired:
+            return _interval(paired[(a, b)][m], z)
+        mean, low, high = _interval(paired[(b, a)][m], z)
+        return (-mean, -high, -low)
+
+    def ranking(m):
+        return sorted(labels, key=lambda label: (single[label][m].mean, labels.index(label)))
+
+    def settled():
+        for m in range(len(metrics)):
+            order = ranking(m)
+            for a, b in zip(order, order[1:]):
+                _, low, high = difference(a, b, m)
+                if not (high < 0 or low > 0 or (low >= -tolerance and high <= tolerance)):
+                    return False
+        return True
+
+    done, stopped = 0, False
+    pool = ProcessPoolExecutor(max_workers=workers) if workers != 1 else None
+    try:
+        while done < max_replications:
+            size = min(batch_size, max_replications - done)
+            jobs = [(spec, seed, i, candidates, tail) for i in range(done, done + size)]
+            if pool:
+                # Chunking only changes how jobs are shipped, not result order
+                chunk = max(1, size // (4 * (workers or os.cpu_count() or 1)))
+                results = pool.map(_replicate, jobs, chunksize=chunk)
+            else:
+                results = map(_replicate, jobs)
+            # Results come back in replication order whatever the worker count
+            for row in results:
+                for m, column in enumerate(columns):
+                    values = [r[column] for r in row]
+                    for i, a in enumerate(labels):
+                        single[a][m].add(values[i])
+                        for j in range(i + 1, k):
+                            paired[(a, labels[j])][m].add(values[i] - values[j])
+            done += size
+            if done >= min_replications and settled():
+                stopped = True
+                break
+    finally:
+        if pool:
+            pool.shutdown()
+
+    rankings = {metric: ranking(m) for m, metric in enumerate(metrics)}
+    estimates = {label: {metric: _interval(single[label][m], z)
+                         for m, metric in enumerate(metrics)} for label in labels}
+    differences = {}
+    for m, metric in enumerate(metrics):
+        order = rankings[metric]
+        for a, b in zip(order, order[1:]):
+            differences.setdefault((a, b), {})[metric] = difference(a, b, m)
+    return ComparisonResult(done, stopped, rankings, estimates, differences)
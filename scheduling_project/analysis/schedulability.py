@@ -0,0 +1,128 @@
+# Schedulability tests for periodic task sets, without simulation
+
+from collections import namedtuple
+from math import ceil
+
+from algorithms.realtime import hyperperiod, normalize_tasks
+
+# schedulable = bool
+# utilization = total CPU utilization (float)
+# test = name of the test that decided
+# response_times = {name: worst-case response time or None if it exceeds
+#                   the deadline} for rate monotonic, else None
+Analysis = namedtuple("Analysis", ["schedulable", "utilization", "test", "response_times"])
+
+
+def utilization(tasks):
+    return sum(task[2] / task[1] for task in tasks)
+
+
+def _over_one(tasks):
+    """Exact U > 1 check in integers (float sums can land just above 1)"""
+    h = hyperperiod(tasks)
+    return sum(wcet * (h // period) for _, period, wcet, _ in tasks) > h
+
+
+def liu_layland_bound(n):
+    """Rate-monotonic utilization bound n(2^(1/n) - 1)"""
+    return n * (2 ** (1 / n) - 1) if n else 1.0
+
+
+def response_times(tasks):
+    """
+    Worst-case response time of each task under rate monotonic
+    (iterative R = C + sum(ceil(R / Tj) * Cj) over higher-priority tasks)
+    Returns: {name: R or None when R exceeds the deadline}
+    Deadlines beyond the period are checked as equal to it, which is safe
+    but may reject some feasible sets.
+    """
+    order = sorted(range(len(tasks)), key=lambda i: (tasks[i][1], i))
+    result = {}
+    higher = []  # (period, wcet) of tasks already placed
+    for i in order:
+        name, period, wcet, deadline = tasks[i]
+        deadline = min(deadline, period)
+        r = wcet + sum(c for _, c in higher)
+        while r <= deadline:
+            nxt = wcet + sum(ceil(r / p) * c for p, c in higher)
+            if nxt == r:
+                break
+            r = nxt
+        result[name] = r if r <= deadline else None
+        higher.append((period, wcet))
+    return result
+
+
+def _demand(tasks, t):
+    """Processor demand: work with both release and deadline in [0, t]"""
+    return sum(((t - d) // p + 1) * c for _, p, c, d in tasks if t >= d)
+
+
+def _last_deadline_before(tasks, t):
+    """Largest absolute deadline strictly before t"""
+    best = 0
+    for _, p, _, d in tasks:
+        if t > d:
+            best = max(best, ((t - d - 1) // p) * p + d)
+    return best
+
+
+def edf_demand_test(tasks):
+    """
+    Exact EDF test for constrained deadlines: quick processor-demand
+    analysis (QPA), which walks backwards through the deadlines that
+    matter instead of checking every one up to the busy period
+    """
+    if _over_one(tasks):
+        return False
+    # Synchronous busy period bounds the deadlines that need checking
+    busy = sum(c for _, _, c, _ in tasks)
+    while True:
+        nxt = sum(ceil(busy / p) * c for _, p, c, _ in tasks)
+        if nxt == busy:
+            break
+        busy = nxt
+    d_min = min(d for _, _, _, d in tasks)
+    t = _last_deadline_before(tasks, busy + 1)
+    while True:
+        h = _demand(tasks, t)
+        if h > t:
+            return False
+        if h <= d_min:
+            return True
+        t = h if h < t else _last_deadline_before(tasks, t)
+
+
+def analyze(tasks, policy="edf"):
+    """
+    Accept or reject a periodic task set without simulating it
+    policy = "edf" or "rm"
+    Cheap utilization bounds decide most sets; the rest fall through to
+    processor-demand analysis (EDF) or response-time analysis (RM).
+    Returns: Analysis
+    """
+    if policy not in ("edf", "rm"):
+        raise ValueError(f"Unknown policy: {policy}")
+    tasks = normalize_tasks(tasks)
+    u = utilization(tasks)
+    if not tasks:
+        return Analysis(True, 0.0, "utilization", {} if policy == "rm" else None)
+    if _over_one(tasks):
+        return Analysis(False, u, "utilization", None)
+    implicit = all(d == p for _, p, _, d in tasks)
+
+    if policy == "edf":
+        if all(d >= p for _, p, _, d in tasks):
+            return Analysis(True, u, "utilization", None)
+        return Analysis(edf_demand_test(tasks), u, "processor_demand", None)
+
+    if implicit:
+        if u <= liu_layland_bound(len(tasks)) * (1 - 1e-12):
+            return Analysis(True, u, "liu_layland", None)
+        product = 1.0
+        for _, p, c, _ in tasks:
+            product *= c / p + 1
+        if product <= 2 * (1 - 1e-12):
+            return Analysis(True, u, "hyperbolic", None)
+    times = response_times(tasks)
+    return Analysis(all(r is not None for r in times.values()), u, "response_time", times)
@@ -0,0 +1,118 @@
+# Queryable index over a schedule's segments
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from analysis.metrics import iter_segments
+
+
+class ScheduleIndex:
+    """
+    Point, range and per-process queries over (name, start, end) segments
+    A single CPU never runs two segments at once, so sorted start/end
+    arrays answer every query with a bisect: O(log n + k) for k results.
+    Per-process queries use each process's own sorted run list.
+    """
+
+    def __init__(self, segments=()):
+        self.starts = array('q')
+        self.ends = array('q')
+        self.ids = array('l')
+        self.names = []
+        self._name_ids = {}
+        self._runs = []  # name id -> array of segment indices
+        for name, start, end in segments:
+            self.append(name, start, end)
+
+    @classmethod
+    def from_schedule(cls, schedule):
+        """Build from a per-time-unit schedule as returned by algorithms/"""
+        return cls(iter_segments(schedule))
+
+    def append(self, name, start, end):
+        """Add a segment that starts at or after the end of the last one"""
+        if self.ends and start < self.ends[-1]:
+            raise ValueError("Segments must be appended in time order")
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+            self._runs.append(array('l'))
+        self._runs[name_id].append(len(self.starts))
+        self.starts.append(start)
+        self.ends.append(end)
+        self.ids.append(name_id)
+
+    def __len__(self):
+        return len(self.starts)
+
+    @property
+    def end_time(self):
+        return self.ends[-1] if self.ends else 0
+
+    def name_id(self, name):
+        """Internal id of a process name, or None"""
+        return self._name_ids.get(name)
+
+    def segment(self, i):
+        """Segment i as (name, start, end)"""
+        return (self.names[self.ids[i]], self.starts[i], self.ends[i])
+
+    def index_at(self, t):
+        """Index of the segment running at time t, or None"""
+        i = bisect_right(self.starts, t) - 1
+        if i >= 0 and t < self.ends[i]:
+            return i
+        return None
+
+    def at(self, t):
+        """Who was running at time t: (name, start, end) or None"""
+        i = self.index_at(t)
+        return None if i is None else self.segment(i)
+
+    def index_range(self, t0, t1):
+        """Indices [first, last) of segments intersecting [t0, t1)"""
+        first = bisect_right(self.ends, t0)
+        last = bisect_left(self.starts, t1)
+        return first, max(first, last)
+
+    def overlapping(self, t0, t1):
+        """Segments intersecting [t0, t1) as (name, start, end)"""
+        first, last = self.index_range(t0, t1)
+        return [self.segment(i) for i in range(first, last)]
+
+    def runs_of(self, name, t0=None, t1=None):
+        """
+        All runs of one process as (start, end), optionally only those
+        intersecting [t0, t1)
+        """
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            return []
+        runs = self._runs[name_id]
+        first, last = 0, len(runs)
+        if t0 is not None:
+            # Runs are in time order, so bisect on their end times
+            lo, hi = 0, len(runs)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self.ends[runs[mid]] <= t0:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            first = lo
+        if t1 is not None:
+            lo, hi = first, len(runs)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self.starts[runs[mid]] < t1:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            last = lo
+        return [(self.starts[runs[k]], self.ends[runs[k]]) for k in range(first, last)]
+
+    def run_position(self, i):
+        """(k, total): segment i is run k (1-based) of total for its process"""
+        runs = self._runs[self.ids[i]]
+        return bisect_left(runs, i) + 1, len(runs)
@@ -0,0 +1,209 @@
+# Constant-memory streaming metrics with percentile sketches
+
+import math
+
+
+class RunningStat:
+    """Running count, mean, variance, min and max (Welford's method)"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+
+    @property
+    def variance(self):
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def merge(self, other):
+        """Combine with another RunningStat (e.g. from a parallel run)"""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self._m2 = other.count, other.mean, other._m2
+            self.min, self.max = other.min, other.max
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+
+class LogHistogram:
+    """
+    Percentile sketch over signed values
+    Buckets grow geometrically with |x|, so any quantile is reported
+    within relative_error of the true value (values in (-1, 1) share one
+    bucket) and memory only depends on the range of values, never on
+    how many were added.
+    """
+
+    def __init__(self, relative_error=0.01):
+        self.relative_error = relative_error
+        self._gamma = (1 + relative_error) / (1 - relative_error)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets = {}  # bucket index -> count; negative index for x <= -1
+        self.count = 0
+
+    def add(self, x, n=1):
+        magnitude = abs(x)
+        if magnitude < 1:
+            index = 0
+        else:
+            index = int(math.ceil(math.log(magnitude) / self._log_gamma)) + 1
+            if x < 0:
+                index = -index
+        self._buckets[index] = self._buckets.get(index, 0) + n
+        self.count += n
+
+    def quantile(self, q):
+        """Approximate nearest-rank q-quantile (0 <= q <= 1), or None when empty"""
+        if self.count == 0:
+            return None
+        rank = max(math.ceil(q * self.count), 1)
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return self._value(index)
+        return self._value(max(self._buckets))
+
+    def _value(self, index):
+        if index == 0:
+            return 0.0
+        if index < 0:
+            return -self._value(-index)
+        # Midpoint of (gamma^(i-2), gamma^(i-1)] in relative terms
+        return 2 * self._gamma ** (index - 1) / (self._gamma + 1)
+
+    def merge(self, other):
+        for index, n in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + n
+        self.count += other.count
+
+
+class MetricSummary:
+    """Running moments plus a percentile sketch for one metric"""
+
+    def __init__(self, relative_error=0.01):
+        self.stat = RunningStat()
+        self.histogram = LogHistogram(relative_error)
+
+    def add(self, x):
+        self.stat.add(x)
+        self.histogram.add(x)
+
+    def merge(self, other):
+        self.stat.merge(other.stat)
+        self.histogram.merge(other.histogram)
+
+    def as_dict(self, percentiles=(50, 95, 99)):
+        result = {
+            "count": self.stat.count,
+            "mean": self.stat.mean,
+            "std": self.stat.std,
+            "min": self.stat.min,
+            "max": self.stat.max,
+        }
+        for p in percentiles:
+            value = self.histogram.quantile(p / 100)
+            if value is not None:
+                # Bucket midpoints can overshoot the observed range
+                value = min(max(value, self.stat.min), self.stat.max)
+            result[f"p{p}"] = value
+        return result
+
+
+class StreamingMetrics:
+    """
+    One-pass TAT / WT / RT aggregator
+    Feed completion events with add_completion(), or arrivals plus
+    schedule segments with arrive() and add_segment(). Only processes
+    that have arrived but not yet finished are kept in memory.
+    """
+
+    METRICS = ("tat", "wt", "rt")
+
+    def __init__(self, relative_error=0.01):
+        self.summaries = {m: MetricSummary(relative_error) for m in self.METRICS}
+        self.completed = 0
+        self._active = {}  # name -> [arrival, burst, executed, first_run]
+
+    def add_completion(self, arrival, burst, completion, first_run=None):
+        """Record one finished process"""
+        tat = completion - arrival
+        self.summaries["tat"].add(tat)
+        self.summaries["wt"].add(tat - burst)
+        if first_run is not None:
+            self.summaries["rt"].add(first_run - arrival)
+        self.completed += 1
+
+    def arrive(self, name, arrival, burst):
+        """Register a process before its segments are consumed"""
+        self._active[name] = [arrival, burst, 0, None]
+
+    def is_active(self, name):
+        """True if name has arrived and not yet finished"""
+        return name in self._active
+
+    @property
+    def active_count(self):
+        """Number of processes currently held in memory"""
+        return len(self._active)
+
+    def add_segment(self, name, start, end):
+        """Consume a (name, start, end) run; idle and unknown names are skipped"""
+        state = self._active.get(name)
+        if state is None:
+            return
+        if state[3] is None:
+            state[3] = start
+        state[2] += end - start
+        if state[2] >= state[1]:
+            del self._active[name]
+            self.add_completion(state[0], state[1], end, state[3])
+
+    def merge(self, other):
+        for m in self.METRICS:
+            self.summaries[m].merge(other.summaries[m])
+        self.completed += other.completed
+
+    def summary(self, percentiles=(50, 95, 99)):
+        return {m: s.as_dict(percentiles) for m, s in self.summaries.items()}
+
+
+def stream_schedule_metrics(segments, processes, relative_error=0.01):
+    """
+    Aggregate metrics from (name, start, end) segments in one pass
+    processes = iterable of (name, arrival, burst, ...) sorted by arrival;
+    each process is registered once the clock reaches its arrival time,
+    so segments must cover idle time ("Idle") as the algorithms emit it
+    """
+    metrics = StreamingMetrics(relative_error)
+    pending = iter(processes)
+    upcoming = next(pending, None)
+    for name, start, end in segments:
+        while upcoming is not None and upcoming[1] <= start:
+            metrics.arrive(upcoming[0], upcoming[1], upcoming[2])
+            upcoming = next(pending, None)
+        metrics.add_segment(name, start, end)
+    return metrics
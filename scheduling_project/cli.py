@@ -0,0 +1,245 @@
+"""
+Headless command-line interface for the CPU scheduler
+Never imports PyQt6 or matplotlib so it starts fast in shell pipelines
+"""
+import argparse
+import csv
+import json
+import sys
+
+from analysis.metrics import iter_segments
+from analysis.streaming import stream_schedule_metrics
+from engine.runner import ALGORITHMS, run
+from workload.bulk import load_processes
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="scheduling_project",
+        description="CPU scheduling simulator",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Run a scheduling algorithm on a workload")
+    run_parser.add_argument("--algo", required=True, choices=sorted(ALGORITHMS),
+                            help="Scheduling algorithm")
+    run_parser.add_argument("--quantum", type=int, default=2,
+                            help="Time quantum for round_robin (default: 2)")
+    run_parser.add_argument("--target-latency", type=int, default=6,
+                            help="Target latency for cfs (default: 6)")
+    run_parser.add_argument("--min-granularity", type=int, default=1,
+                            help="Minimum slice for cfs (default: 1)")
+    run_parser.add_argument("--input", required=True,
+                            help="Workload file (.csv, .json or .npy); for cfs the "
+                                 "priority column is the nice value")
+    run_parser.add_argument("--format", choices=["text", "csv", "json"], default="text",
+                            help="Output format for stdout (default: text)")
+    run_parser.add_argument("--segments-out", metavar="PATH",
+                            help="Also write segments to a .csv or .json file")
+    run_parser.add_argument("--metrics-out", metavar="PATH",
+                            help="Also write metrics to a .csv or .json file")
+    run_parser.add_argument("--summary", action="store_true",
+                            help="Print mean/std/P50/P95/P99 of TAT, WT and RT "
+                                 "instead of per-process metrics")
+    run_parser.add_argument("--quiet", action="store_true",
+                            help="Do not write results to stdout")
+
+    compare_parser = sub.add_parser(
+        "compare", help="Rank algorithms on seeded random workloads (Monte Carlo)")
+    compare_parser.add_argument("--spec", required=True,
+                                help="Workload distribution as a JSON file or inline JSON")
+    compare_parser.add_argument("--algos", nargs="+",
+                                default=["sjf", "srtf", "round_robin:2", "round_robin:4"],
+                                help="Candidates; round_robin:Q sets the quantum "
+                                     "(default: sjf srtf round_robin:2 round_robin:4)")
+    compare_parser.add_argument("--seed", type=int, default=0,
+                                help="Seed of the workload family (default: 0)")
+    compare_parser.add_argument("--workers", type=int, default=None,
+                                help="Worker processes (default: all CPUs; "
+                                     "results do not depend on this)")
+    compare_parser.add_argument("--confidence", type=float, default=0.95,
+                                help="Joint confidence level (default: 0.95)")
+    compare_parser.add_argument("--tolerance", type=float, default=0.0,
+                                help="Differences within +-this count as ties (default: 0)")
+    compare_parser.add_argument("--min-replications", type=int, default=20,
+                                help="Workloads before stopping is considered (default: 20)")
+    compare_parser.add_argument("--max-replications", type=int, default=2000,
+                                help="Upper limit on workloads (default: 2000)")
+    compare_parser.add_argument("--batch-size", type=int, default=20,
+                                help="Workloads between stop checks (default: 20)")
+    compare_parser.add_argument("--tail", type=float, default=0.95,
+                                help="Quantile used for tail waiting time (default: 0.95)")
+    compare_parser.add_argument("--format", choices=["text", "json"], default="text",
+                                help="Output format for stdout (default: text)")
+    return parser
+
+
+def metric_rows(metrics):
+    """Per-process metrics as (name, ct, tat, wt, rt) rows"""
+    for name, m in metrics["processes"].items():
+        yield (name, m["ct"], m["tat"], m["wt"], m["rt"])
+
+
+def write_segments(segments, out, fmt):
+    """Stream (name, start, end) segments to a file object"""
+    if fmt == "csv":
+        writer = csv.writer(out)
+        writer.writerow(["name", "start", "end"])
+        writer.writerows(segments)
+    elif fmt == "json":
+        out.write("[")
+        for i, (name, start, end) in enumerate(segments):
+            out.write(("," if i else "") + json.dumps([name, start, end]))
+        out.write("]\n")
+    else:
+        for name, start, end in segments:
+            out.write(f"{start:>8} {end:>8}  {name}\n")
+
+
+def write_metrics(metrics, out, fmt):
+    """Write per-process metrics and averages to a file object"""
+    if fmt == "csv":
+        writer = csv.writer(out)
+        writer.writerow(["name", "ct", "tat", "wt", "rt"])
+        writer.writerows(metric_rows(metrics))
+    elif fmt == "json":
+        json.dump(metrics, out)
+        out.write("\n")
+    else:
+        for name, ct, tat, wt, rt in metric_rows(metrics):
+            out.write(f"{name}: CT={ct} | TAT={tat} | WT={wt} | RT={rt}\n")
+        out.write(f"Avg TAT: {metrics['avg_tat']:.2f} | Avg WT: {metrics['avg_wt']:.2f} "
+                  f"| Avg RT: {metrics['avg_rt']:.2f}\n")
+
+
+def write_summary(summary, out, fmt):
+    """Write a StreamingMetrics summary to a file object"""
+    if fmt == "json":
+        json.dump(summary, out)
+        out.write("\n")
+        return
+    fields = ["count", "mean", "std", "min", "max", "p50", "p95", "p99"]
+    if fmt == "csv":
+        writer = csv.writer(out)
+        writer.writerow(["metric"] + fields)
+        for metric, values in summary.items():
+            writer.writerow([metric] + [values[f] for f in fields])
+    else:
+        for metric, values in summary.items():
+            out.write(f"{metric.upper()}: " + " | ".join(
+                f"{f}={values[f]:.2f}" if isinstance(values[f], float) else f"{f}={values[f]}"
+                for f in fields) + "\n")
+
+
+def _file_format(path):
+    return "json" if path.lower().endswith(".json") else "csv"
+
+
+def run_command(args, out):
+    try:
+        # Same rules as the GUI: unique IDs, arrival >= 0, burst > 0
+        processes = load_processes(args.input)
+    except (OSError, ValueError, KeyError, IndexError, TypeError) as e:
+        print(f"error: cannot load {args.input}: {e}", file=sys.stderr)
+        return 1
+
+    params = {}
+    if args.algo == "round_robin":
+        params = {"quantum": args.quantum}
+    elif args.algo == "cfs":
+        params = {"target_latency": args.target_latency,
+                  "min_granularity": args.min_granularity}
+    try:
+        result = run(args.algo, processes, **params)
+    except (ValueError, IndexError) as e:
+        print(f"error: {args.algo} failed: {e}", file=sys.stderr)
+        return 1
+
+    if args.segments_out:
+        with open(args.segments_out, "w", newline="") as f:
+            write_segments(iter_segments(result.schedule), f, _file_format(args.segments_out))
+    if args.metrics_out:
+        with open(args.metrics_out, "w", newline="") as f:
+            write_metrics(result.metrics, f, _file_format(args.metrics_out))
+
+    if args.quiet:
+        return 0
+    if args.summary:
+        ordered = sorted(processes, key=lambda p: p[1])
+        summary = stream_schedule_metrics(iter_segments(result.schedule), ordered).summary()
+        write_summary(summary, out, args.format)
+        return 0
+    if args.format == "json":
+        out.write('{"algorithm": %s, "segments": ' % json.dumps(args.algo))
+        write_segments(iter_segments(result.schedule), out, "json")
+        out.write(', "metrics": ')
+        write_metrics(result.metrics, out, "json")
+        out.write("}\n")
+    else:
+        write_segments(iter_segments(result.schedule), out, args.format)
+        out.write("\n")
+        write_metrics(result.metrics, out, args.format)
+    return 0
+
+
+def _load_spec(spec):
+    if spec.lstrip().startswith("{"):
+        return json.loads(spec)
+    with open(spec) as f:
+        return json.load(f)
+
+
+def compare_command(args, out):
+    from analysis.montecarlo import compare
+
+    try:
+        spec = _load_spec(args.spec)
+    except (OSError, ValueError) as e:
+        print(f"error: cannot load spec {args.spec}: {e}", file=sys.stderr)
+        return 1
+    try:
+        result = compare(spec, args.algos, seed=args.seed, workers=args.workers,
+                         confidence=args.confidence, tolerance=args.tolerance,
+                         min_replications=args.min_replications,
+                         max_replications=args.max_replications,
+                         batch_size=args.batch_size, tail=args.tail)
+    except (ValueError, KeyError, TypeError) as e:
+        print(f"error: compare failed: {e}", file=sys.stderr)
+        return 1
+
+    if args.format == "json":
+        json.dump({
+            "replications": result.replications,
+            "settled": result.settled,
+            "ranking": result.ranking,
+            "estimates": result.estimates,
+            "differences": [{"a": a, "b": b, **d} for (a, b), d in result.differences.items()],
+        }, out)
+        out.write("\n")
+        return 0
+
+    state = "settled" if result.settled else "not settled (limit reached)"
+    out.write(f"{result.replications} workloads, ranking {state}\n")
+    for metric, order in result.ranking.items():
+        out.write(f"\n{metric} (lower is better):\n")
+        for label in order:
+            mean, low, high = result.estimates[label][metric]
+            out.write(f"  {label:<16} {mean:10.2f}  [{low:.2f}, {high:.2f}]\n")
+        for a, b in zip(order, order[1:]):
+            mean, low, high = result.differences[(a, b)][metric]
+            out.write(f"  {a} - {b}: {mean:.2f} [{low:.2f}, {high:.2f}]\n")
+    return 0
+
+
+def main(argv=None, out=None):
+    args = build_parser().parse_args(argv)
+    out = out or sys.stdout
+    if args.command == "run":
+        return run_command(args, out)
+    if args.command == "compare":
+        return compare_command(args, out)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
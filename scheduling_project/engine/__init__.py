@@ -0,0 +1 @@
+# Engine package for running and caching scheduling algorithms
\ No newline at end of file
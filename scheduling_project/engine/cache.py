@@ -0,0 +1,214 @@
+# Content-addressed LRU cache for scheduling results
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+from collections import OrderedDict
+
+# Bumped whenever the schedule format changes, so stale on-disk results
+# (e.g. from before idle-skipping algorithms wrote "Idle") are never served
+SCHEDULE_FORMAT = 2
+
+# Digests of recently hashed tuple workloads: id -> (workload, digest)
+# The workload is kept so its id cannot be reused by another object
+_DIGESTS = OrderedDict()
+_MAX_DIGESTS = 8
+
+
+def workload_digest(processes):
+    """
+    Hex digest of a process list, O(n) to compute
+    Tuples are immutable, so their digest is memoized by identity and
+    repeated lookups of the same tuple are O(1); pass a tuple (and keep
+    it) to make cache hits independent of the workload size.
+    """
+    if isinstance(processes, tuple):
+        entry = _DIGESTS.get(id(processes))
+        if entry is not None and entry[0] is processes:
+            _DIGESTS.move_to_end(id(processes))
+            return entry[1]
+    payload = json.dumps([list(p) for p in processes], separators=(",", ":"), default=str)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    if isinstance(processes, tuple):
+        _DIGESTS[id(processes)] = (processes, digest)
+        while len(_DIGESTS) > _MAX_DIGESTS:
+            _DIGESTS.popitem(last=False)
+    return digest
+
+
+def workload_key(algorithm, processes, params=None, digest=None):
+    """
+    Hash the workload, the algorithm name and its parameters
+    Identical inputs always map to the same hex digest
+    digest = precomputed workload_digest(processes), if the caller keeps one
+    """
+    payload = json.dumps(
+        [SCHEDULE_FORMAT, algorithm, sorted((params or {}).items()),
+         digest or workload_digest(processes)],
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def value_nbytes(value, sample=256, _seen=None):
+    """
+    Approximate in-memory size of a cached value
+    Shared objects (e.g. the process names repeated through a schedule)
+    are counted once; containers with more than sample distinct children
+    are measured on an evenly spaced sample and scaled up.
+    """
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        items = [*value.keys(), *value.values()]
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = value
+    else:
+        return size
+    children = [v for i, v in {id(v): v for v in items}.items() if i not in seen]
+    if len(children) <= sample:
+        return size + sum(value_nbytes(v, sample, seen) for v in children)
+    step = len(children) / sample
+    measured = sum(value_nbytes(children[int(k * step)], sample, seen) for k in range(sample))
+    return size + int(measured * step)
+
+
+class ResultCache:
+    """
+    Two-tier result cache: in-memory LRU bounded by max_entries and
+    max_bytes, plus an optional on-disk tier that evicts least recently
+    used files past max_disk_bytes. A value bigger than max_bytes is only
+    kept on disk. Cached values are shared between callers and must not
+    be mutated.
+    """
+
+    def __init__(self, max_entries=128, disk_dir=None, max_disk_bytes=256 * 1024 * 1024,
+                 max_bytes=256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()  # key -> (value, nbytes)
+        self._memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def get(self, key):
+        """Return the cached value for key, or None on a miss"""
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        value = self._disk_get(key)
+        if value is not None:
+            self._memory_put(key, value)
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        """Store value in memory and, if enabled, on disk"""
+        self._memory_put(key, value)
+        self._disk_put(key, value)
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for key, calling compute() on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Drop every entry from both tiers"""
+        self._memory.clear()
+        self._memory_bytes = 0
+        if self.disk_dir:
+            for entry in os.scandir(self.disk_dir):
+                if entry.name.endswith(".pkl"):
+                    os.remove(entry.path)
+
+    def __len__(self):
+        return len(self._memory)
+
+    @property
+    def nbytes(self):
+        """Approximate size of the in-memory tier"""
+        return self._memory_bytes
+
+    def _memory_put(self, key, value):
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= old[1]
+        nbytes = value_nbytes(value)
+        if nbytes > self.max_bytes:
+            return
+        self._memory[key] = (value, nbytes)
+        self._memory_bytes += nbytes
+        while len(self._memory) > self.max_entries or self._memory_bytes > self.max_bytes:
+            _, (_, size) = self._memory.popitem(last=False)
+            self._memory_bytes -= size
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, key + ".pkl")
+
+    def _disk_get(self, key):
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        os.utime(path)  # mark as recently used for eviction
+        return value
+
+    def _disk_put(self, key, value):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self._evict_disk()
+
+    def _evict_disk(self):
+        entries = [e for e in os.scandir(self.disk_dir) if e.name.endswith(".pkl")]
+        total = sum(e.stat().st_size for e in entries)
+        if total <= self.max_disk_bytes:
+            return
+        # Oldest access first
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries:
+            if total <= self.max_disk_bytes:
+                break
+            total -= entry.stat().st_size
+            os.remove(entry.path)
+
+
+_default_cache = None
+
+
+def get_default_cache():
+    """
+    Process-wide cache shared by the GUI and batch paths
+    Set SCHEDULER_CACHE_DIR to enable the on-disk tier
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResultCache(disk_dir=os.environ.get("SCHEDULER_CACHE_DIR"))
+    return _default_cache
@@ -0,0 +1,342 @@
+# Discrete-event simulation of processes with CPU and I/O bursts
+
+import heapq
+import numbers
+from collections import deque, namedtuple
+
+INF = float("inf")
+
+DEFAULT_DEVICE = "disk"
+
+# segments = [(name, start, end)] including Idle gaps (None if not recorded)
+# metrics = compute_metrics() format plus cpu/io/io_wait per process
+# devices = {name: {"busy", "served", "utilization"}}
+SimResult = namedtuple("SimResult", ["segments", "metrics", "devices", "end_time", "events"])
+
+
+class Policy:
+    """
+    CPU selection rule: the ready job with the smallest key runs next,
+    ties going to the job that became ready first
+    preemptive = re-check the choice whenever a job becomes ready
+    quantum = time slice, or None to run each burst to completion
+    """
+    preemptive = False
+    quantum = None
+
+    def key(self, remaining, burst, priority):
+        return 0
+
+
+class FCFSPolicy(Policy):
+    """
+    Ready order, as algorithms/fcfs.py
+    Jobs become ready in arrival order, while algorithms/fcfs.py runs its
+    input in list order: the two only agree on input sorted by arrival.
+    """
+
+
+class SJFPolicy(Policy):
+    """Shortest CPU burst, as algorithms/sjf.py"""
+
+    def key(self, remaining, burst, priority):
+        return burst
+
+
+class SRTFPolicy(Policy):
+    """Shortest remaining burst with preemption, as algorithms/srtf.py"""
+    preemptive = True
+
+    def key(self, remaining, burst, priority):
+        return remaining
+
+
+class PriorityPolicy(Policy):
+    """
+    Lowest priority number first, as algorithms/priority.py
+    preemptive = True also preempts the running job for a better one
+    """
+
+    def __init__(self, preemptive=False):
+        self.preemptive = preemptive
+
+    def key(self, remaining, burst, priority):
+        return priority
+
+
+class RoundRobinPolicy(Policy):
+    """Ready order with a time slice, as algorithms/round_robin.py"""
+
+    def __init__(self, quantum=2):
+        if quantum <= 0:
+            raise ValueError("Quantum must be positive")
+        self.quantum = quantum
+
+
+# Same names as engine.runner.ALGORITHMS
+POLICIES = {
+    "fcfs": FCFSPolicy,
+    "sjf": SJFPolicy,
+    "srtf": SRTFPolicy,
+    "priority": PriorityPolicy,
+    "round_robin": RoundRobinPolicy,
+}
+
+
+def get_policy(policy, quantum=2):
+    """Policy instance from a name in POLICIES or an instance"""
+    if isinstance(policy, Policy):
+        return policy
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy}")
+    if policy == "round_robin":
+        return RoundRobinPolicy(quantum)
+    return POLICIES[policy]()
+
+
+def parse_bursts(bursts):
+    """
+    Normalize a burst sequence to ([cpu lengths], [(device, io length)])
+    bursts = an int (one CPU burst) or an alternating sequence
+             cpu, io, cpu, ..., cpu where each io is a length on the
+             default device or a (device, length) pair
+    """
+    if isinstance(bursts, int):
+        bursts = (bursts,)
+    if len(bursts) % 2 == 0:
+        raise ValueError("Bursts must start and end with a CPU burst")
+    cpu, io = [], []
+    for k, burst in enumerate(bursts):
+        if k % 2 == 0:
+            if burst <= 0:
+                raise ValueError("CPU bursts must be positive")
+            cpu.append(burst)
+        else:
+            device, length = (DEFAULT_DEVICE, burst) if not isinstance(burst, (tuple, list)) else burst
+            if length <= 0:
+                raise ValueError("I/O bursts must be positive")
+            io.append((device, length))
+    return cpu, io
+
+
+def simulate(jobs, policy="fcfs", devices=None, quantum=2, record=True,
+             on_segment=None, stats=None):
+    """
+    Event-driven single-CPU simulation
+    jobs = [(name, arrival, bursts)] or [(name, arrival, bursts, priority)];
+           plain (name, arrival, burst) workloads are single-burst jobs
+    policy = name in POLICIES or a Policy instance
+    devices = optional {device: servers}; each device serves its FIFO queue
+              with that many servers (undeclared devices get one;
+              counts must be positive integers)
+    record = keep the segment list; on_segment(name, start, end) streams
+             segments instead when the list would be too large
+    stats = optional engine.instrument.RunStats
+    Pending I/O completions live in a binary heap; arrivals come from a
+    sorted list and the CPU's completion is a single slot that a
+    preemption simply overwrites.
+    Returns: SimResult
+    """
+    policy = get_policy(policy, quantum)
+    key, preemptive, slice_len = policy.key, policy.preemptive, policy.quantum
+
+    names, arrivals, priorities, cpu_bursts, io_bursts = [], [], [], [], []
+    for job in jobs:
+        cpu, io = parse_bursts(job[2])
+        names.append(job[0])
+        arrivals.append(job[1])
+        priorities.append(job[3] if len(job) > 3 else 0)
+        cpu_bursts.append(cpu)
+        io_bursts.append(io)
+    if len(set(names)) != len(names):
+        raise ValueError("Process IDs must be unique!")
+    n = len(names)
+
+    # Device state: free servers, FIFO of (job, queued since), busy time, served count
+    servers = dict(devices or {})
+    for device, count in servers.items():
+        if not isinstance(count, numbers.Integral) or count <= 0:
+            raise ValueError(f"Device {device} needs a positive number of servers")
+    for io in io_bursts:
+        for device, _ in io:
+            servers.setdefault(device, 1)
+    free = dict(servers)
+    device_queue = {d: deque() for d in servers}
+    device_busy = dict.fromkeys(servers, 0)
+    device_served = dict.fromkeys(servers, 0)
+
+    phase = [0] * n          # index of the current CPU burst
+    remaining = [0] * n      # time left in the current CPU burst
+    ready_seq = [0] * n      # queue position kept across preemptions
+    ready_since = [0] * n
+    first_run = [None] * n
+    completion = [None] * n
+    wait = [0] * n
+    io_time = [0] * n
+    io_wait = [0] * n
+    on_device = [None] * n
+
+    # Arrivals are consumed in order from a sorted list; the heap only holds
+    # I/O completions, and the single CPU needs just one completion slot
+    order = sorted(range(n), key=arrivals.__getitem__)
+    a = 0
+    events = []  # heap of (time, seq, job)
+    push, pop = heapq.heappush, heapq.heappop
+    seq = 0
+
+    # Ready order policies (FCFS, round robin) use a plain FIFO
+    fifo = type(policy).key is Policy.key and not preemptive
+    ready = deque() if fifo else []  # heap of (key, seq, job)
+    running, run_start, cpu_done, last_end = -1, 0, INF, 0
+    processed = 0
+
+    segments = [] if record else None
+    pending = None  # last segment, held back so consecutive slices merge
+
+    def emit(name, start, end):
+        nonlocal pending
+        if pending is not None:
+            if pending[0] == name and pending[2] == start:
+                pending = (name, pending[1], end)
+                return
+            if record:
+                segments.append(pending)
+            if on_segment:
+                on_segment(*pending)
+        pending = (name, start, end)
+
+    def make_ready(j, now, requeue=True):
+        """requeue=False keeps the job's place (preempted, not out of quantum)"""
+        nonlocal seq
+        ready_since[j] = now
+        if stats is not None:
+            stats.enqueue(now, names[j])
+        if fifo:
+            ready.append(j)
+            return
+        if requeue:
+            ready_seq[j] = seq
+            seq += 1
+        push(ready, (key(remaining[j], cpu_bursts[j][phase[j]], priorities[j]), ready_seq[j], j))
+
+    def start_io(device, j, length, now):
+        nonlocal seq
+        device_busy[device] += length
+        device_served[device] += 1
+        io_time[j] += length
+        push(events, (now + length, seq, j))
+        seq += 1
+
+    while True:
+        # Next timestamp; at equal times arrivals are queued first, then
+        # I/O completions, then the job whose CPU slice ends, as in
+        # algorithms/round_robin.py
+        now = cpu_done
+        if events and events[0][0] < now:
+            now = events[0][0]
+        if a < n and arrivals[order[a]] < now:
+            now = arrivals[order[a]]
+        if now == INF:
+            break
+
+        while a < n and arrivals[order[a]] == now:
+            j = order[a]
+            a += 1
+            processed += 1
+            remaining[j] = cpu_bursts[j][0]
+            make_ready(j, now)
+
+        while events and events[0][0] == now:
+            j = pop(events)[2]
+            processed += 1
+            device = on_device[j]
+            queue = device_queue[device]
+            if queue:
+                k, since = queue.popleft()
+                io_wait[k] += now - since
+                start_io(device, k, io_bursts[k][phase[k]][1], now)
+            else:
+                free[device] += 1
+            phase[j] += 1
+            remaining[j] = cpu_bursts[j][phase[j]]
+            make_ready(j, now)
+
+        if cpu_done == now:
+            j = running
+            processed += 1
+            remaining[j] -= now - run_start
+            emit(names[j], run_start, now)
+            if stats is not None:
+                stats.dispatch(run_start, names[j], now - run_start)
+            running, cpu_done, last_end = -1, INF, now
+            if remaining[j] > 0:
+                make_ready(j, now)  # time slice expired: back of the queue
+            elif phase[j] == len(io_bursts[j]):
+                completion[j] = now
+            else:
+                device, length = io_bursts[j][phase[j]]
+                on_device[j] = device
+                if free[device]:
+                    free[device] -= 1
+                    start_io(device, j, length, now)
+                else:
+                    device_queue[device].append((j, now))
+
+        if running >= 0 and preemptive and ready:
+            j = running
+            left = remaining[j] - (now - run_start)
+            if ready[0][0] < key(left, cpu_bursts[j][phase[j]], priorities[j]):
+                if now > run_start:
+                    emit(names[j], run_start, now)
+                    if stats is not None:
+                        stats.dispatch(run_start, names[j], now - run_start)
+                remaining[j] = left
+                running, cpu_done, last_end = -1, INF, now
+                make_ready(j, now, requeue=False)
+
+        if running < 0 and ready:
+            j = ready.popleft() if fifo else pop(ready)[2]
+            if now > last_end:
+                emit("Idle", last_end, now)
+                if stats is not None:
+                    stats.idle(last_end, now - last_end)
+            wait[j] += now - ready_since[j]
+            if first_run[j] is None:
+                first_run[j] = now
+            if stats is not None:
+                stats.dequeue(now, names[j])
+            running, run_start = j, now
+            cpu_done = now + (remaining[j] if slice_len is None else min(slice_len, remaining[j]))
+
+    if pending is not None:
+        if record:
+            segments.append(pending)
+        if on_segment:
+            on_segment(*pending)
+
+    end_time = last_end
+    per_process = {}
+    for j in range(n):
+        ct = completion[j]
+        tat = ct - arrivals[j]
+        per_process[names[j]] = {
+            "ct": ct, "tat": tat, "wt": wait[j], "rt": first_run[j] - arrivals[j],
+            "cpu": sum(cpu_bursts[j]), "io": io_time[j], "io_wait": io_wait[j],
+        }
+    metrics = {"processes": per_process}
+    for f in ("tat", "wt", "rt"):
+        metrics[f"avg_{f}"] = sum(m[f] for m in per_process.values()) / n if n else 0.0
+    device_report = {
+        d: {"busy": device_busy[d], "served": device_served[d],
+            "utilization": device_busy[d] / (servers[d] * end_time) if end_time else 0.0}
+        for d in servers
+    }
+    return SimResult(segments, metrics, device_report, end_time, processed)
+
+
+def to_schedule(segments):
+    """Per-time-unit schedule, same format as algorithms/ (integer times only)"""
+    schedule = []
+    for name, start, end in segments:
+        schedule.extend([name] * (end - start))
+    return schedule
@@ -0,0 +1,267 @@
+# Checkpointed incremental re-simulation for what-if edits
+
+import heapq
+from bisect import bisect_right
+from collections import deque, namedtuple
+
+# Scheduler state at the top of a loop iteration
+# ready holds heap entries (key, seq, ...) or round robin (name, remaining) pairs
+Checkpoint = namedtuple("Checkpoint", ["time", "index", "seq", "ready", "segments"])
+
+# Order in which each algorithm admits processes (None = input order)
+_ADMIT_ORDER = {
+    "fcfs": None,
+    "sjf": lambda p: (p[1], p[2]),
+    "priority": lambda p: (p[1], p[3]),
+    "srtf": lambda p: p[1],
+    "round_robin": lambda p: p[1],
+}
+
+
+class IncrementalScheduler:
+    """
+    Keeps a schedule up to date across process edits
+    Produces the same schedule as the matching function in algorithms/,
+    but stores periodic checkpoints so that adding, removing or replacing
+    a process resumes from the last checkpoint before the edit instead of
+    time 0. Once the edited run reaches the same state as the previous
+    run, the rest of the previous schedule is reused as is.
+    """
+
+    def __init__(self, algorithm, processes=(), quantum=2, checkpoint_every=1024):
+        if algorithm not in _ADMIT_ORDER:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self.quantum = quantum
+        self.checkpoint_every = checkpoint_every
+        self._order = _ADMIT_ORDER[algorithm]
+
+        procs = [tuple(p) for p in processes]
+        self._by_name = {p[0]: p for p in procs}
+        if len(self._by_name) != len(procs):
+            raise ValueError("Process IDs must be unique!")
+        if self._order is not None:
+            procs.sort(key=self._order)
+            self._keys = [self._order(p) for p in procs]
+        self._procs = procs
+
+        self._segments = []  # (name, length) in schedule order
+        self._checkpoints = [Checkpoint(0, 0, 0, [], 0)]
+        self._simulate(self._checkpoints[0])
+
+    @property
+    def processes(self):
+        """Processes in admission order"""
+        return list(self._procs)
+
+    @property
+    def segments(self):
+        """Schedule as (name, length) runs; do not mutate"""
+        return self._segments
+
+    def segments_with_times(self):
+        """Schedule as (name, start, end) runs"""
+        position = 0
+        for name, length in self._segments:
+            yield (name, position, position + length)
+            position += length
+
+    def schedule(self):
+        """Schedule as a list of process names per time unit"""
+        schedule = []
+        for name, length in self._segments:
+            schedule.extend([name] * length)
+        return schedule
+
+    def add_process(self, process):
+        """Add a process and update the schedule"""
+        process = tuple(process)
+        if process[0] in self._by_name:
+            raise ValueError(f"Process {process[0]} already exists!")
+        position = self._insert(process)
+        k = self._resume_point(position, process[1])
+        self._resimulate(k, 1, position + 1)
+
+    def remove_process(self, name):
+        """Remove a process by name and update the schedule"""
+        position = self._position(name)
+        k = self._resume_point(position, self._procs[position][1])
+        self._delete(position)
+        self._resimulate(k, -1, position)
+
+    def replace_process(self, name, process):
+        """
+        Swap a process for an edited version and update the schedule
+        FCFS keeps the process in place; other algorithms re-admit it
+        after any processes with an equal sort key, as add_process does.
+        """
+        process = tuple(process)
+        if process[0] != name and process[0] in self._by_name:
+            raise ValueError(f"Process {process[0]} already exists!")
+        old_position = self._position(name)
+        k = self._resume_point(old_position, self._procs[old_position][1])
+        self._delete(old_position)
+        new_position = self._insert(process, old_position)
+        k = min(k, self._resume_point(new_position, process[1]))
+        self._resimulate(k, 0, max(old_position, new_position) + 1)
+
+    def _insert(self, process, fcfs_position=None):
+        if self._order is None:
+            position = len(self._procs) if fcfs_position is None else fcfs_position
+        else:
+            key = self._order(process)
+            position = bisect_right(self._keys, key)
+            self._keys.insert(position, key)
+        self._procs.insert(position, process)
+        self._by_name[process[0]] = process
+        return position
+
+    def _delete(self, position):
+        process = self._procs.pop(position)
+        if self._order is not None:
+            del self._keys[position]
+        del self._by_name[process[0]]
+
+    def _position(self, name):
+        if name not in self._by_name:
+            raise KeyError(f"Process {name} not found")
+        process = self._by_name[name]
+        if self._order is None:
+            return self._procs.index(process)
+        position = bisect_right(self._keys, self._order(process)) - 1
+        while self._procs[position][0] != name:
+            position -= 1
+        return position
+
+    def _resume_point(self, position, arrival):
+        """
+        Index of the last checkpoint that an edit at position cannot affect:
+        the edited process was not yet admitted and, for arrival-ordered
+        algorithms, the clock had not yet reached its arrival time.
+        """
+        checkpoints = self._checkpoints
+        k = bisect_right([cp.index for cp in checkpoints], position) - 1
+        if self._order is not None:
+            while k > 0 and checkpoints[k].time >= arrival:
+                k -= 1
+        return max(k, 0)
+
+    def _resimulate(self, k, delta, edit_end):
+        start = self._checkpoints[k]
+        previous = self._checkpoints[k + 1:]
+        del self._checkpoints[k + 1:]
+        previous_tail = self._segments[start.segments:]
+        del self._segments[start.segments:]
+        self._simulate(start, previous, previous_tail, delta, edit_end)
+
+    def _simulate(self, start, previous=(), previous_tail=(), delta=0, edit_end=0):
+        """
+        Run the scheduling loop from a checkpoint to the end
+        previous = checkpoints of the last run after start
+        delta = change in process count since the last run
+        edit_end = first index past every edited process
+        """
+        procs, n = self._procs, len(self._procs)
+        segments, checkpoints = self._segments, self._checkpoints
+        algorithm, quantum, every = self.algorithm, self.quantum, self.checkpoint_every
+        heappush, heappop, heapreplace = heapq.heappush, heapq.heappop, heapq.heapreplace
+
+        time, i, seq = start.time, start.index, start.seq
+        ready = deque(start.ready) if algorithm == "round_robin" else list(start.ready)
+        j, since = 0, 0
+
+        while i < n or ready:
+            # Reuse the previous run once both runs are in the same state
+            while j < len(previous) and previous[j].time < time:
+                j += 1
+            if (j < len(previous) and previous[j].time == time and i >= edit_end
+                    and previous[j].index + delta == i
+                    and self._same_ready(previous[j].ready, ready)):
+                self._splice(previous[j:], previous_tail, start.segments, delta)
+                return
+
+            since += 1
+            if since >= every and since >= len(ready):
+                checkpoints.append(Checkpoint(time, i, seq, list(ready), len(segments)))
+                since = 0
+
+            if algorithm == "fcfs":
+                name, at, bt = procs[i][:3]
+                if time < at:
+                    # CPU idle until process arrives
+                    segments.append(("Idle", at - time))
+                    time = at
+                segments.append((name, bt))
+                time += bt
+                i += 1
+
+            elif algorithm == "round_robin":
+                while i < n and procs[i][1] <= time:
+                    ready.append((procs[i][0], procs[i][2]))
+                    i += 1
+                if not ready:
+                    # CPU idle until the next arrival
+                    segments.append(("Idle", procs[i][1] - time))
+                    time = procs[i][1]
+                    continue
+                name, remaining = ready.popleft()
+                run_time = min(quantum, remaining)
+                segments.append((name, run_time))
+                time += run_time
+                while i < n and procs[i][1] <= time:
+                    ready.append((procs[i][0], procs[i][2]))
+                    i += 1
+                if remaining > run_time:
+                    ready.append((name, remaining - run_time))
+
+            elif algorithm == "srtf":
+                while i < n and procs[i][1] <= time:
+                    heappush(ready, (procs[i][2], seq, procs[i][0]))
+                    seq += 1
+                    i += 1
+                if not ready:
+                    # CPU idle until the next arrival
+                    segments.append(("Idle", procs[i][1] - time))
+                    time = procs[i][1]
+                    continue
+                remaining, s, name = ready[0]
+                # Run until completion or the next arrival
+                run_time = min(remaining, procs[i][1] - time) if i < n else remaining
+                segments.append((name, run_time))
+                time += run_time
+                if run_time == remaining:
+                    heappop(ready)
+                else:
+                    heapreplace(ready, (remaining - run_time, s, name))
+
+            else:  # sjf / priority
+                key_field = 2 if algorithm == "sjf" else 3
+                while i < n and procs[i][1] <= time:
+                    heappush(ready, (procs[i][key_field], seq, procs[i]))
+                    seq += 1
+                    i += 1
+                if not ready:
+                    # CPU idle until the next arrival
+                    segments.append(("Idle", procs[i][1] - time))
+                    time = procs[i][1]
+                    continue
+                process = heappop(ready)[2]
+                segments.append((process[0], process[2]))
+                time += process[2]
+
+    def _same_ready(self, previous_ready, ready):
+        if len(previous_ready) != len(ready):
+            return False
+        if self.algorithm == "round_robin":
+            return list(ready) == previous_ready
+        # Compare pick order; seq numbers differ between runs
+        return ([(e[0], e[2]) for e in sorted(ready)]
+                == [(e[0], e[2]) for e in sorted(previous_ready)])
+
+    def _splice(self, previous, previous_tail, tail_offset, delta):
+        shift = len(self._segments) - previous[0].segments
+        self._segments.extend(previous_tail[previous[0].segments - tail_offset:])
+        self._checkpoints.extend(
+            cp._replace(index=cp.index + delta, segments=cp.segments + shift)
+            for cp in previous
+        )
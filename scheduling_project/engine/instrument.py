@@ -0,0 +1,129 @@
+# Instrumentation counters, trace hooks and profiling for scheduling runs
+
+import cProfile
+import json
+import pstats
+import time as _time
+
+
+class RunStats:
+    """
+    Per-run counters filled in by the scheduling algorithms
+    Pass an instance as stats= to an algorithm; leave it as None to
+    skip instrumentation entirely. trace(event, time, name, value) is
+    called for every event when given.
+    """
+
+    def __init__(self, trace=None):
+        self.trace = trace
+        self.enqueues = 0
+        self.dequeues = 0
+        self.sorts = 0
+        self.sorted_items = 0
+        self.dispatches = 0
+        self.context_switches = 0
+        self.busy_ticks = 0
+        self.idle_ticks = 0
+        self._last = None
+
+    def enqueue(self, time, name):
+        self.enqueues += 1
+        if self.trace:
+            self.trace("enqueue", time, name, 1)
+
+    def dequeue(self, time, name):
+        self.dequeues += 1
+        if self.trace:
+            self.trace("dequeue", time, name, 1)
+
+    def sort(self, time, size):
+        self.sorts += 1
+        self.sorted_items += size
+        if self.trace:
+            self.trace("sort", time, None, size)
+
+    def dispatch(self, time, name, length):
+        """Record name running for length ticks starting at time"""
+        self.dispatches += 1
+        self.busy_ticks += length
+        if self._last is not None and self._last != name:
+            self.context_switches += 1
+        self._last = name
+        if self.trace:
+            self.trace("dispatch", time, name, length)
+
+    def idle(self, time, length):
+        self.idle_ticks += length
+        if self.trace:
+            self.trace("idle", time, None, length)
+
+    def as_dict(self):
+        return {
+            "enqueues": self.enqueues,
+            "dequeues": self.dequeues,
+            "sorts": self.sorts,
+            "sorted_items": self.sorted_items,
+            "dispatches": self.dispatches,
+            "context_switches": self.context_switches,
+            "busy_ticks": self.busy_ticks,
+            "idle_ticks": self.idle_ticks,
+        }
+
+
+def profile_run(algorithm, processes, mode="timer", trace=None, top=20, **params):
+    """
+    Run an algorithm with counters and a wall-clock or cProfile wrapper
+    mode = "timer" or "cprofile"
+    Returns: (schedule, report dict ready for JSON export)
+    """
+    from engine.runner import ALGORITHMS
+
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    if mode not in ("timer", "cprofile"):
+        raise ValueError(f"Unknown profiling mode: {mode}")
+
+    stats = RunStats(trace=trace)
+    func = ALGORITHMS[algorithm]
+    profiler = cProfile.Profile() if mode == "cprofile" else None
+
+    start = _time.perf_counter()
+    if profiler:
+        profiler.enable()
+    schedule = func(processes, stats=stats, **params)
+    if profiler:
+        profiler.disable()
+    elapsed = _time.perf_counter() - start
+
+    report = {
+        "algorithm": algorithm,
+        "params": params,
+        "processes": len(processes),
+        "schedule_length": len(schedule),
+        "wall_time_s": elapsed,
+        "counters": stats.as_dict(),
+    }
+    if profiler:
+        report["profile"] = _profile_rows(profiler, top)
+    return schedule, report
+
+
+def _profile_rows(profiler, top):
+    """Flatten cProfile output into the top functions by cumulative time"""
+    rows = []
+    for (filename, line, func), (cc, nc, tt, ct, _) in pstats.Stats(profiler).stats.items():
+        rows.append({
+            "function": f"{filename}:{line}({func})",
+            "calls": nc,
+            "primitive_calls": cc,
+            "total_time_s": tt,
+            "cumulative_time_s": ct,
+        })
+    rows.sort(key=lambda r: r["cumulative_time_s"], reverse=True)
+    return rows[:top]
+
+
+def export_json(report, path):
+    """Write a profiling report to a JSON file"""
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, default=str)
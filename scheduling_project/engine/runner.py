@@ -0,0 +1,55 @@
+# Shared entry point for running scheduling algorithms
+
+from collections import namedtuple
+
+from algorithms.fcfs import fcfs
+from algorithms.sjf import sjf
+from algorithms.srtf import srtf
+from algorithms.priority import priority_scheduling
+from algorithms.round_robin import round_robin
+from algorithms.cfs import cfs
+from analysis.metrics import compute_metrics
+from engine.cache import get_default_cache, workload_key
+
+# Algorithm name -> scheduling function
+ALGORITHMS = {
+    "fcfs": fcfs,
+    "sjf": sjf,
+    "srtf": srtf,
+    "priority": priority_scheduling,
+    "round_robin": round_robin,
+    "cfs": cfs,
+}
+
+RunResult = namedtuple("RunResult", ["schedule", "metrics"])
+
+
+def run(algorithm, processes, cache=None, use_cache=True, stats=None, scheduler=None, **params):
+    """
+    Run a scheduling algorithm and compute its metrics
+    Results are looked up in the shared cache by workload hash first;
+    the hash of a tuple workload is memoized, so repeat runs on the same
+    tuple skip re-hashing it
+    params are passed to the algorithm (e.g. quantum for round_robin,
+    target_latency / min_granularity for cfs)
+    stats = optional engine.instrument.RunStats; forces a fresh run
+    scheduler = optional callable returning the schedule on a miss (e.g.
+                an IncrementalScheduler's schedule) instead of the algorithm
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    func = ALGORITHMS[algorithm]
+
+    def compute():
+        if scheduler is not None:
+            schedule = scheduler()
+        else:
+            schedule = func(processes, stats=stats, **params)
+        return RunResult(schedule, compute_metrics(schedule, processes))
+
+    if not use_cache or stats is not None:
+        return compute()
+    if cache is None:
+        cache = get_default_cache()
+    key = workload_key(algorithm, processes, params)
+    return cache.get_or_compute(key, compute)
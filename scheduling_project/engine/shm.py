@@ -0,0 +1,192 @@
+# Zero-copy shared-memory transport for parallel simulation results
+
+from collections import namedtuple
+from concurrent.futures import CancelledError, ProcessPoolExecutor, as_completed
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from analysis.metrics import compute_metrics, iter_segments
+
+# Small, picklable handle sent back from a worker instead of the result
+ResultDescriptor = namedtuple(
+    "ResultDescriptor", ["shm_name", "algorithm", "params", "n_segments", "n_processes"]
+)
+
+IDLE_ID = -1
+METRIC_FIELDS = ("ct", "tat", "wt", "rt")
+
+
+def _layout(n_segments, n_processes):
+    """Byte offsets of each array in the shared block (int64 first, then int32)"""
+    starts = 0
+    lengths = starts + 8 * n_segments
+    metrics = lengths + 8 * n_segments
+    ids = metrics + 8 * len(METRIC_FIELDS) * n_processes
+    size = ids + 4 * n_segments
+    return starts, lengths, metrics, ids, max(size, 1)
+
+
+def _views(buf, n_segments, n_processes):
+    starts, lengths, metrics, ids, _ = _layout(n_segments, n_processes)
+    return (
+        np.ndarray((n_segments,), dtype=np.int64, buffer=buf, offset=starts),
+        np.ndarray((n_segments,), dtype=np.int64, buffer=buf, offset=lengths),
+        np.ndarray((len(METRIC_FIELDS), n_processes), dtype=np.int64, buffer=buf, offset=metrics),
+        np.ndarray((n_segments,), dtype=np.int32, buffer=buf, offset=ids),
+    )
+
+
+def run_to_shared_memory(algorithm, processes, params=None):
+    """
+    Run an algorithm and publish the result in a new shared memory block
+    Segments reference processes by their index in processes (-1 = Idle);
+    metrics are stored per process in the same order (-1 = not completed).
+    Returns: ResultDescriptor
+    """
+    from engine.runner import ALGORITHMS
+
+    params = params or {}
+    schedule = ALGORITHMS[algorithm](processes, **params)
+    index = {p[0]: i for i, p in enumerate(processes)}
+    segments = list(iter_segments(schedule))
+    metrics = compute_metrics(schedule, processes)["processes"]
+
+    n_segments, n_processes = len(segments), len(processes)
+    shm = shared_memory.SharedMemory(create=True, size=_layout(n_segments, n_processes)[-1])
+    starts, lengths, metric_table, ids = _views(shm.buf, n_segments, n_processes)
+    starts[:] = np.fromiter((s[1] for s in segments), dtype=np.int64, count=n_segments)
+    lengths[:] = np.fromiter((s[2] - s[1] for s in segments), dtype=np.int64, count=n_segments)
+    ids[:] = np.fromiter((index.get(s[0], IDLE_ID) for s in segments), dtype=np.int32,
+                         count=n_segments)
+    metric_table.fill(-1)
+    for name, m in metrics.items():
+        metric_table[:, index[name]] = [m[f] for f in METRIC_FIELDS]
+
+    del starts, lengths, metric_table, ids
+    descriptor = ResultDescriptor(shm.name, algorithm, params, n_segments, n_processes)
+    # The parent owns the block from here on: it attaches and unlinks it,
+    # so the worker's resource tracker must not clean it up on exit
+    resource_tracker.unregister(shm._name, "shared_memory")
+    shm.close()
+    return descriptor
+
+
+def _run_job(job):
+    algorithm, processes, params = job
+    return run_to_shared_memory(algorithm, processes, params)
+
+
+class SharedResult:
+    """
+    Parent-side view of a result in shared memory
+    Arrays are numpy views straight into the shared block; call close()
+    (or use as a context manager) to release and unlink it.
+    """
+
+    def __init__(self, descriptor, processes):
+        self.descriptor = descriptor
+        self.algorithm = descriptor.algorithm
+        self.params = descriptor.params
+        self.names = [p[0] for p in processes]
+        self._shm = shared_memory.SharedMemory(name=descriptor.shm_name)
+        (self.segment_starts, self.segment_lengths,
+         self.metric_table, self.segment_ids) = _views(
+            self._shm.buf, descriptor.n_segments, descriptor.n_processes)
+
+    def iter_segments(self):
+        """Yields: (name, start, end)"""
+        names = self.names
+        for start, length, name_id in zip(self.segment_starts.tolist(),
+                                          self.segment_lengths.tolist(),
+                                          self.segment_ids.tolist()):
+            yield (names[name_id] if name_id != IDLE_ID else "Idle", start, start + length)
+
+    def schedule(self):
+        """Per-time-unit schedule, same format as algorithms/"""
+        schedule = []
+        for name, start, end in self.iter_segments():
+            schedule.extend([name] * (end - start))
+        return schedule
+
+    def metrics(self):
+        """Metrics in the same format as analysis.metrics.compute_metrics"""
+        per_process = {}
+        table = self.metric_table.tolist()
+        for i, name in enumerate(self.names):
+            if table[0][i] >= 0:
+                per_process[name] = {f: table[k][i] for k, f in enumerate(METRIC_FIELDS)}
+        done = len(per_process)
+        result = {"processes": per_process}
+        for f in ("tat", "wt", "rt"):
+            result[f"avg_{f}"] = sum(m[f] for m in per_process.values()) / done if done else 0.0
+        return result
+
+    def close(self):
+        if self._shm is None:
+            return
+        del self.segment_starts, self.segment_lengths, self.metric_table, self.segment_ids
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _unlink(descriptor):
+    """Release a block no SharedResult was built for"""
+    try:
+        shm = shared_memory.SharedMemory(name=descriptor.shm_name)
+    except OSError:
+        return  # already gone
+    shm.close()
+    shm.unlink()
+
+
+def run_parallel(jobs, workers=None):
+    """
+    Run (algorithm, processes, params) jobs in worker processes
+    Only descriptors cross the process boundary; results stay in shared memory
+    If any job fails, the blocks of the jobs that finished are unlinked
+    before the first failure (in job order) is re-raised.
+    Returns: [SharedResult] in job order; close each one when done
+    """
+    jobs = [(a, list(p), dict(params or {})) for a, p, params in jobs]
+    resource_tracker.ensure_running()  # share one tracker with the workers
+    descriptors = [None] * len(jobs)
+    errors = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_run_job, job): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                descriptors[i] = future.result()
+            except CancelledError:
+                continue
+            except Exception as e:
+                errors[i] = e
+                # Jobs that have not started yet would only be thrown away
+                for other in futures:
+                    other.cancel()
+
+    if errors:
+        for descriptor in descriptors:
+            if descriptor is not None:
+                _unlink(descriptor)
+        raise errors[min(errors)]
+
+    results = []
+    try:
+        for descriptor, job in zip(descriptors, jobs):
+            results.append(SharedResult(descriptor, job[1]))
+    except BaseException:
+        for result in results:
+            result.close()
+        for descriptor in descriptors[len(results):]:
+            _unlink(descriptor)
+        raise
+    return results
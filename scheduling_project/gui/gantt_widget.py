@@ -0,0 +1,329 @@
+"""
+Native QPainter Gantt chart with zoom, pan and viewport culling
+Draws only the segments inside the visible time range; when more
+segments are visible than there are pixels, one sample per pixel
+column is drawn instead. Hovering shows who was running; clicking a
+segment highlights every run of that process. With a Telemetry
+attached, T toggles an overlay of paint times and FPS.
+"""
+from PyQt6.QtWidgets import QWidget, QToolTip
+from PyQt6.QtCore import Qt, QRectF, QPointF
+from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QStaticText
+
+from analysis.schedule_index import ScheduleIndex
+
+# Same palette as the animated chart
+DEFAULT_COLORS = ["#FFD700", "#87CEEB", "#98FB98", "#DDA0DD", "#F0E68C"]
+IDLE_COLOR = "#404040"
+
+
+class GanttWidget(QWidget):
+    """Zoomable, pannable single-CPU Gantt chart"""
+
+    BAR_TOP = 30
+    BAR_HEIGHT = 60
+    AXIS_GAP = 20
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(600, 160)
+        self.setMouseTracking(True)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+
+        self.index = ScheduleIndex()
+        self._brushes = []
+        self._labels = {}  # name id -> QStaticText
+        self._highlight = None  # highlighted process name
+        self.telemetry = None  # optional visualization.telemetry.Telemetry
+        self.show_telemetry = True
+
+        self._view_start = 0.0
+        self._view_span = 1.0
+        self._drag_x = None
+        self._drag_moved = False
+        self._font = QFont("Times New Roman", 11)
+        self._font.setBold(True)
+
+    # ---- data ----
+
+    def set_schedule(self, segments, colors=None):
+        """
+        Show (name, start, end) segments sorted by start time
+        segments may also be a prebuilt ScheduleIndex
+        colors = optional {name: "#rrggbb"}
+        """
+        self.set_index(segments if isinstance(segments, ScheduleIndex)
+                       else ScheduleIndex(segments), colors)
+
+    def set_schedule_from_ticks(self, schedule, colors=None):
+        """Show a per-time-unit schedule as returned by algorithms/"""
+        self.set_index(ScheduleIndex.from_schedule(schedule), colors)
+
+    def set_index(self, index, colors=None):
+        colors = colors or {}
+        self.index = index
+        self._labels = {}
+        self._brushes = []
+        for name_id, name in enumerate(index.names):
+            if name == "Idle":
+                color = colors.get(name, IDLE_COLOR)
+            else:
+                color = colors.get(name, DEFAULT_COLORS[name_id % len(DEFAULT_COLORS)])
+            self._brushes.append(QColor(color))
+        if self._highlight is not None and index.name_id(self._highlight) is None:
+            self._highlight = None
+        if self.telemetry is not None:
+            self.telemetry.schedule_length = index.end_time
+        self.fit()
+
+    def set_telemetry(self, telemetry):
+        """Record paint timings into telemetry (None turns it off)"""
+        self.telemetry = telemetry
+        if telemetry is not None:
+            telemetry.schedule_length = self.index.end_time
+        self.update()
+
+    def highlight(self, name):
+        """Outline every run of one process (None clears the highlight)"""
+        self._highlight = name
+        self.update()
+
+    # ---- view ----
+
+    def fit(self):
+        """Show the whole schedule"""
+        self._view_start = 0.0
+        self._view_span = float(max(self.index.end_time, 1))
+        self.update()
+
+    def set_view(self, start, end):
+        self._view_span = max(float(end - start), 1e-3)
+        self._view_start = float(start)
+        self._clamp_view()
+        self.update()
+
+    def zoom(self, factor, anchor_x=None):
+        """Zoom by factor (>1 zooms in) keeping anchor_x pixel fixed"""
+        if anchor_x is None:
+            anchor_x = self.width() / 2
+        anchor_t = self._x_to_time(anchor_x)
+        self._view_span = max(self._view_span / factor, 1e-3)
+        self._view_start = anchor_t - anchor_x / self.width() * self._view_span
+        self._clamp_view()
+        self.update()
+
+    def _clamp_view(self):
+        limit = max(self.index.end_time, 1)
+        self._view_span = min(self._view_span, limit * 1.05)
+        self._view_start = max(-0.025 * limit,
+                               min(self._view_start, limit * 1.025 - self._view_span))
+
+    def _x_to_time(self, x):
+        return self._view_start + x / max(self.width(), 1) * self._view_span
+
+    def _time_to_x(self, t):
+        return (t - self._view_start) / self._view_span * self.width()
+
+    def segment_at(self, t):
+        """Index of the segment running at time t, or None"""
+        return self.index.index_at(t)
+
+    # ---- painting ----
+
+    def paintEvent(self, event):
+        telemetry = self.telemetry
+        if telemetry is not None:
+            telemetry.frame_start()
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#1a1a1a"))
+        if not len(self.index):
+            painter.setPen(QColor("#cccccc"))
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "No schedule")
+            painter.end()
+            return
+
+        width = self.width()
+        t0 = self._view_start
+        t1 = t0 + self._view_span
+        first, last = self.index.index_range(t0, t1)
+
+        if last - first > width:
+            drawn = self._paint_sampled(painter, width)
+        else:
+            drawn = self._paint_segments(painter, first, last)
+        if self._highlight is not None:
+            self._paint_highlight(painter, t0, t1)
+        self._paint_axis(painter, width)
+        if telemetry is not None:
+            if self.show_telemetry:
+                self._paint_telemetry(painter)
+            painter.end()
+            telemetry.frame_end(artists=drawn)
+            return
+        painter.end()
+
+    def _paint_segments(self, painter, first, last):
+        top, height = self.BAR_TOP, self.BAR_HEIGHT
+        scale = self.width() / self._view_span
+        border = QPen(QColor("#FFD700"))
+        border.setWidth(1)
+        painter.setFont(self._font)
+        starts, ends, ids = self.index.starts, self.index.ends, self.index.ids
+        for i in range(first, last):
+            x0 = (starts[i] - self._view_start) * scale
+            w = (ends[i] - starts[i]) * scale
+            rect = QRectF(x0, top, max(w, 1.0), height)
+            painter.fillRect(rect, self._brushes[ids[i]])
+            if w >= 4:
+                painter.setPen(border)
+                painter.drawRect(rect)
+            label = self._label(ids[i])
+            size = label.size()
+            if w >= size.width() + 6:
+                painter.setPen(QColor("white"))
+                painter.drawStaticText(
+                    QPointF(x0 + (w - size.width()) / 2, top + (height - size.height()) / 2),
+                    label)
+        return last - first
+
+    def _paint_sampled(self, painter, width):
+        """One time sample per pixel column for very dense views"""
+        top, height = self.BAR_TOP, self.BAR_HEIGHT
+        index, ids, brushes = self.index, self.index.ids, self._brushes
+        step = self._view_span / width
+        t = self._view_start
+        run_x, run_id = 0, None
+        drawn = 0
+        for x in range(width + 1):
+            i = index.index_at(t) if x < width else None
+            name_id = ids[i] if i is not None else None
+            if name_id != run_id or x == width:
+                if run_id is not None:
+                    painter.fillRect(QRectF(run_x, top, x - run_x, height), brushes[run_id])
+                    drawn += 1
+                run_x, run_id = x, name_id
+            t += step
+        return drawn
+
+    def _paint_highlight(self, painter, t0, t1):
+        """Outline the visible runs of the highlighted process"""
+        scale = self.width() / self._view_span
+        pen = QPen(QColor("white"))
+        pen.setWidth(3)
+        painter.setPen(pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        for start, end in self.index.runs_of(self._highlight, t0, t1):
+            x0 = (start - self._view_start) * scale
+            painter.drawRect(QRectF(x0, self.BAR_TOP - 4, max((end - start) * scale, 2.0),
+                                    self.BAR_HEIGHT + 8))
+
+    def _paint_telemetry(self, painter):
+        """Timings of the previous frame, top-left corner"""
+        painter.setFont(QFont("Monospace", 8))
+        rect = QRectF(4, 2, self.width() - 8, self.BAR_TOP - 4)
+        painter.fillRect(rect, QColor(0, 0, 0, 160))
+        painter.setPen(QColor("#90EE90"))
+        text = self.telemetry.overlay_text().replace("\n", "  ·  ")
+        painter.drawText(rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+
+    def _paint_axis(self, painter, width):
+        y = self.BAR_TOP + self.BAR_HEIGHT + self.AXIS_GAP
+        painter.setPen(QPen(QColor("#FFD700"), 2))
+        painter.drawLine(0, y - 10, width, y - 10)
+        step = _tick_step(self._view_span, max(width // 80, 1))
+        t = int(self._view_start // step) * step
+        painter.setFont(QFont("Times New Roman", 9))
+        while t <= self._view_start + self._view_span:
+            x = self._time_to_x(t)
+            if x >= 0:
+                painter.setPen(QColor("#FFD700"))
+                painter.drawLine(int(x), y - 14, int(x), y - 6)
+                painter.setPen(QColor("white"))
+                painter.drawText(QPointF(x + 2, y + 8), str(t))
+            t += step
+
+    def _label(self, name_id):
+        label = self._labels.get(name_id)
+        if label is None:
+            label = QStaticText(self.index.names[name_id])
+            label.prepare(font=self._font)
+            self._labels[name_id] = label
+        return label
+
+    # ---- interaction ----
+
+    def wheelEvent(self, event):
+        factor = 1.25 if event.angleDelta().y() > 0 else 0.8
+        self.zoom(factor, event.position().x())
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._drag_x = event.position().x()
+            self._drag_moved = False
+
+    def mouseMoveEvent(self, event):
+        x = event.position().x()
+        if self._drag_x is not None:
+            if x != self._drag_x:
+                self._drag_moved = True
+            self._view_start -= (x - self._drag_x) / max(self.width(), 1) * self._view_span
+            self._drag_x = x
+            self._clamp_view()
+            self.update()
+            return
+        self._show_tooltip(event)
+
+    def mouseReleaseEvent(self, event):
+        if self._drag_x is not None and not self._drag_moved:
+            # Click without dragging: toggle the process lane highlight
+            i = self._segment_under(event.position())
+            name = self.index.segment(i)[0] if i is not None else None
+            self.highlight(None if name == self._highlight else name)
+        self._drag_x = None
+
+    def _segment_under(self, pos):
+        if not (self.BAR_TOP <= pos.y() <= self.BAR_TOP + self.BAR_HEIGHT):
+            return None
+        return self.index.index_at(self._x_to_time(pos.x()))
+
+    def _show_tooltip(self, event):
+        i = self._segment_under(event.position())
+        if i is None:
+            QToolTip.hideText()
+            return
+        name, start, end = self.index.segment(i)
+        run, total = self.index.run_position(i)
+        QToolTip.showText(event.globalPosition().toPoint(),
+                          f"{name}: {start}–{end} ({end - start} units)\n"
+                          f"Run {run} of {total}", self)
+
+    def keyPressEvent(self, event):
+        key = event.key()
+        if key == Qt.Key.Key_Home:
+            self.fit()
+        elif key == Qt.Key.Key_T and self.telemetry is not None:
+            self.show_telemetry = not self.show_telemetry
+            self.update()
+        elif key in (Qt.Key.Key_Plus, Qt.Key.Key_Equal):
+            self.zoom(1.25)
+        elif key == Qt.Key.Key_Minus:
+            self.zoom(0.8)
+        elif key == Qt.Key.Key_Left:
+            self.set_view(self._view_start - self._view_span * 0.1,
+                          self._view_start + self._view_span * 0.9)
+        elif key == Qt.Key.Key_Right:
+            self.set_view(self._view_start + self._view_span * 0.1,
+                          self._view_start + self._view_span * 1.1)
+        else:
+            super().keyPressEvent(event)
+
+
+def _tick_step(span, max_ticks):
+    """Smallest 1/2/5 x 10^k integer step giving at most max_ticks ticks"""
+    magnitude = 1
+    while True:
+        for m in (1, 2, 5):
+            step = m * magnitude
+            if span / step <= max_ticks:
+                return step
+        magnitude *= 10
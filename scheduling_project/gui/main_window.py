@@ -4,12 +4,39 @@ Modern PyQt6 GUI for CPU Scheduling with Black & Gold Theme
 import sys
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QGridLayout, QLabel, QLineEdit, 
-                            QPushButton, QTableWidget, QTableWidgetItem, 
+                            QPushButton, QTableView, 
                             QGroupBox, QFrame, QMessageBox, QSpacerItem, 
-                            QSizePolicy)
-from PyQt6.QtCore import Qt, pyqtSignal
+                            QSizePolicy, QComboBox, QCheckBox, QFileDialog)
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont, QIcon, QPainter, QColor
 
+from engine.incremental import IncrementalScheduler
+from gui.process_model import ProcessTableModel
+from visualization.telemetry import Telemetry
+from workload.bulk import load_processes, save_processes
+
+WORKLOAD_FILTER = "Workloads (*.csv *.json *.npy);;CSV (*.csv);;JSON (*.json);;NumPy (*.npy)"
+
+# Column sizing scans rows, so skip it for very large imports
+RESIZE_COLUMNS_LIMIT = 10000
+
+# Telemetry overlay refresh period (also the event-loop lag probe)
+TELEMETRY_INTERVAL_MS = 500
+
+# Playback choices: label -> (speed multiplier, seconds to fit the schedule)
+PLAYBACK_OPTIONS = [
+    ("0.5× speed", 0.5, None),
+    ("1× speed", 1.0, None),
+    ("2× speed", 2.0, None),
+    ("4× speed", 4.0, None),
+    ("8× speed", 8.0, None),
+    ("16× speed", 16.0, None),
+    ("Fit in 10 s", None, 10),
+    ("Fit in 30 s", None, 30),
+    ("Fit in 60 s", None, 60),
+]
+
+
 class ModernSchedulerGUI(QMainWindow):
     """Main window for the CPU Scheduler with modern black & gold theme"""
     
@@ -19,9 +46,18 @@ class ModernSchedulerGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.processes = []  # List of (id, arrival, burst) tuples
+        self.process_ids = set()  # IDs in self.processes, for O(1) duplicate checks
+        self._workload = None  # Tuple snapshot of self.processes, reset on every edit
         self.max_processes = 5
         self.min_processes = 2
         self.animation = None  # Keep reference to animation
+        self.scheduler = IncrementalScheduler("fcfs")  # Updated on every edit
+        self.playback = None  # PlaybackClock of the running animation
+        self.gantt_view = None  # Native Gantt chart window
+        self.telemetry = None  # Telemetry while the overlay is enabled
+        self.telemetry_timer = QTimer(self)
+        self.telemetry_timer.timeout.connect(self.refresh_telemetry)
+        self._telemetry_due = None
         
         self.init_ui()
         self.apply_theme()
@@ -138,6 +174,13 @@ class ModernSchedulerGUI(QMainWindow):
         self.remove_btn.clicked.connect(self.remove_process)
         self.remove_btn.setEnabled(False)
         
+        # Bulk import / export of whole process sets
+        self.import_btn = QPushButton("📂 Import...")
+        self.import_btn.clicked.connect(self.import_processes)
+        self.export_btn = QPushButton("💾 Export...")
+        self.export_btn.clicked.connect(self.export_processes)
+        self.export_btn.setEnabled(False)
+        
         # Layout the input fields
         input_layout.addWidget(pid_label, 0, 0)
         input_layout.addWidget(self.pid_input, 0, 1)
@@ -151,6 +194,8 @@ class ModernSchedulerGUI(QMainWindow):
         button_layout.addWidget(self.add_btn)
         button_layout.addWidget(self.remove_btn)
         button_layout.addStretch()
+        button_layout.addWidget(self.import_btn)
+        button_layout.addWidget(self.export_btn)
         
         input_layout.addLayout(button_layout, 1, 0, 1, 6)
         
@@ -184,13 +229,13 @@ class ModernSchedulerGUI(QMainWindow):
         table_layout.addWidget(self.count_label)
         
         # Process table
-        self.process_table = QTableWidget()
-        self.process_table.setColumnCount(4)
-        self.process_table.setHorizontalHeaderLabels(["Process ID", "Arrival Time", "Burst Time", "Status"])
+        self.process_model = ProcessTableModel(self.processes)
+        self.process_table = QTableView()
+        self.process_table.setModel(self.process_model)
         
         # Style the table
         self.process_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #2d2d2d;
                 color: white;
                 gridline-color: #FFD700;
@@ -226,13 +271,59 @@ class ModernSchedulerGUI(QMainWindow):
         self.clear_btn.setEnabled(False)
         self.clear_btn.setMinimumHeight(50)
         
+        # Playback speed selector (applies live to a running animation)
+        speed_label = QLabel("Playback:")
+        speed_label.setStyleSheet("color: #cccccc; font-size: 14px;")
+        self.speed_combo = QComboBox()
+        for label, _, _ in PLAYBACK_OPTIONS:
+            self.speed_combo.addItem(label)
+        self.speed_combo.setCurrentIndex(1)
+        self.speed_combo.setMinimumHeight(50)
+        self.speed_combo.currentIndexChanged.connect(self.change_speed)
+        
+        # Native Gantt view button
+        self.gantt_btn = QPushButton("📊 Native Gantt View")
+        self.gantt_btn.clicked.connect(self.show_gantt_view)
+        self.gantt_btn.setEnabled(False)
+        self.gantt_btn.setMinimumHeight(50)
+        
         control_layout.addWidget(self.run_btn)
+        control_layout.addWidget(self.gantt_btn)
         control_layout.addWidget(self.clear_btn)
+        control_layout.addWidget(speed_label)
+        control_layout.addWidget(self.speed_combo)
         
         layout.addLayout(control_layout)
     
     def create_status_section(self, layout):
         """Create the status section"""
+        telemetry_layout = QHBoxLayout()
+        self.telemetry_check = QCheckBox("Show performance telemetry")
+        self.telemetry_check.setStyleSheet("color: #cccccc; font-size: 12px;")
+        self.telemetry_check.toggled.connect(self.toggle_telemetry)
+        self.export_telemetry_btn = QPushButton("💾 Export Telemetry")
+        self.export_telemetry_btn.clicked.connect(self.export_telemetry)
+        self.export_telemetry_btn.setEnabled(False)
+        telemetry_layout.addWidget(self.telemetry_check)
+        telemetry_layout.addStretch()
+        telemetry_layout.addWidget(self.export_telemetry_btn)
+        layout.addLayout(telemetry_layout)
+        
+        self.telemetry_label = QLabel()
+        self.telemetry_label.setStyleSheet("""
+            QLabel {
+                color: #90EE90;
+                font-family: monospace;
+                font-size: 11px;
+                padding: 6px;
+                background-color: #000000;
+                border: 1px solid #90EE90;
+                border-radius: 5px;
+            }
+        """)
+        self.telemetry_label.hide()
+        layout.addWidget(self.telemetry_label)
+        
         self.status_label = QLabel("Ready to add processes. Add at least 2 processes to start scheduling.")
         self.status_label.setStyleSheet("""
             QLabel {
@@ -266,6 +357,23 @@ class ModernSchedulerGUI(QMainWindow):
                 border: 2px solid #FFD700;
             }
             
+            QComboBox {
+                background-color: #2d2d2d;
+                color: #FFD700;
+                border: 2px solid #FFD700;
+                border-radius: 8px;
+                padding: 8px 12px;
+                font-size: 14px;
+                font-weight: bold;
+            }
+            
+            QComboBox QAbstractItemView {
+                background-color: #2d2d2d;
+                color: white;
+                selection-background-color: #FFD700;
+                selection-color: black;
+            }
+            
             QPushButton {
                 background-color: #2d2d2d;
                 color: #FFD700;
@@ -309,7 +417,7 @@ class ModernSchedulerGUI(QMainWindow):
             return
         
         # Check if process ID already exists
-        if any(p[0] == pid for p in self.processes):
+        if pid in self.process_ids:
             self.show_error(f"Process {pid} already exists!")
             return
         
@@ -324,6 +432,9 @@ class ModernSchedulerGUI(QMainWindow):
         
         # Add process
         self.processes.append((pid, at, bt))
+        self.process_ids.add(pid)
+        self._workload = None
+        self.schedule_edit(self.scheduler.add_process, (pid, at, bt))
         self.update_table()
         self.clear_inputs()
         self.update_status()
@@ -331,44 +442,93 @@ class ModernSchedulerGUI(QMainWindow):
     def remove_process(self):
         """Remove the last process"""
         if self.processes:
-            self.processes.pop()
+            pid = self.processes.pop()[0]
+            self.process_ids.discard(pid)
+            self._workload = None
+            self.schedule_edit(self.scheduler.remove_process, pid)
             self.update_table()
             self.update_status()
     
     def clear_all(self):
         """Clear all processes"""
         self.processes.clear()
+        self.process_ids.clear()
+        self._workload = None
+        self.scheduler = IncrementalScheduler("fcfs")
+        self.update_table()
+        self.update_status()
+    
+    def import_processes(self):
+        """Append a whole process set from a .csv, .json or .npy file"""
+        path, _ = QFileDialog.getOpenFileName(self, "Import Processes", "", WORKLOAD_FILTER)
+        if not path:
+            return
+        try:
+            # Validated in bulk against the IDs already in the table
+            imported = load_processes(path, existing=self.process_ids)
+        except (OSError, ValueError, KeyError, IndexError, TypeError) as e:
+            self.show_error(f"Could not import {path}: {e}")
+            return
+        
+        # The GUI schedules with FCFS, so a priority column is dropped
+        imported = [p[:3] for p in imported]
+        self.processes.extend(imported)
+        self.process_ids.update(p[0] for p in imported)
+        self._workload = None
+        if self.telemetry is not None:
+            with self.telemetry.scheduling():
+                self.scheduler = IncrementalScheduler("fcfs", self.processes)
+            self.telemetry.schedule_length = sum(length for _, length in self.scheduler.segments)
+        else:
+            self.scheduler = IncrementalScheduler("fcfs", self.processes)
         self.update_table()
         self.update_status()
+        self.status_label.setText(f"Imported {len(imported)} process(es) from {path}")
+    
+    def export_processes(self):
+        """Save the current process set as .csv, .json or .npy"""
+        path, _ = QFileDialog.getSaveFileName(self, "Export Processes", "processes.csv",
+                                              WORKLOAD_FILTER)
+        if not path:
+            return
+        try:
+            save_processes(path, self.processes)
+        except (OSError, ValueError) as e:
+            self.show_error(f"Could not export {path}: {e}")
+            return
+        self.status_label.setText(f"Saved {len(self.processes)} process(es) to {path}")
     
     def update_table(self):
         """Update the process table"""
-        self.process_table.setRowCount(len(self.processes))
-        
-        for i, (pid, at, bt) in enumerate(self.processes):
-            self.process_table.setItem(i, 0, QTableWidgetItem(pid))
-            self.process_table.setItem(i, 1, QTableWidgetItem(str(at)))
-            self.process_table.setItem(i, 2, QTableWidgetItem(str(bt)))
-            self.process_table.setItem(i, 3, QTableWidgetItem("Ready"))
+        self.process_model.set_processes(self.processes)
         
         # Resize columns
-        self.process_table.resizeColumnsToContents()
+        if len(self.processes) <= RESIZE_COLUMNS_LIMIT:
+            self.process_table.resizeColumnsToContents()
     
     def update_status(self):
         """Update the status and button states"""
         count = len(self.processes)
-        self.count_label.setText(f"Processes: {count}/{self.max_processes} (Minimum {self.min_processes} required)")
+        if count > self.max_processes:
+            self.count_label.setText(f"Processes: {count} (animation limit {self.max_processes})")
+        else:
+            self.count_label.setText(f"Processes: {count}/{self.max_processes} (Minimum {self.min_processes} required)")
         
-        # Update button states
+        # Update button states (imports may exceed the animation's limit)
         self.remove_btn.setEnabled(count > 0)
         self.clear_btn.setEnabled(count > 0)
-        self.run_btn.setEnabled(count >= self.min_processes)
+        self.export_btn.setEnabled(count > 0)
+        self.run_btn.setEnabled(self.min_processes <= count <= self.max_processes)
+        self.gantt_btn.setEnabled(count >= self.min_processes)
         
         # Update status message
         if count == 0:
             self.status_label.setText("Ready to add processes. Add at least 2 processes to start scheduling.")
         elif count < self.min_processes:
             self.status_label.setText(f"Add {self.min_processes - count} more process(es) to run the animation.")
+        elif count > self.max_processes:
+            self.status_label.setText(f"{count} processes: the animation shows up to {self.max_processes}; "
+                                      f"use 'Native Gantt View' for the full schedule.")
         else:
             self.status_label.setText(f"Ready to run! Click 'Run FCFS Animation' to see the scheduling.")
     
@@ -400,20 +560,77 @@ class ModernSchedulerGUI(QMainWindow):
         """)
         msg.exec()
     
-    def run_animation(self):
-        """Run the FCFS animation"""
-        if len(self.processes) < self.min_processes:
-            self.show_error(f"Need at least {self.min_processes} processes!")
+    def current_workload(self):
+        """
+        The process list as a tuple, rebuilt only after an edit
+        Reusing the same tuple lets the result cache skip re-hashing it.
+        """
+        if self._workload is None:
+            self._workload = tuple(self.processes)
+        return self._workload
+    
+    def schedule_edit(self, edit, arg):
+        """Apply an incremental scheduler edit, timed when telemetry is on"""
+        if self.telemetry is None:
+            edit(arg)
             return
-        
-        # Import and run the animation
-        from algorithms.fcfs import fcfs
-        from visualization.animate import animate
-        
-        # Convert processes for algorithm
-        processes_for_algo = [(pid, at, bt) for pid, at, bt in self.processes]
-        
-        # Professional color scheme matching the GUI theme
+        with self.telemetry.scheduling():
+            edit(arg)
+        self.telemetry.schedule_length = sum(length for _, length in self.scheduler.segments)
+    
+    def toggle_telemetry(self, enabled):
+        """Show or hide the telemetry overlay here and in the chart windows"""
+        if enabled:
+            self.telemetry = Telemetry()
+            self.telemetry_label.setText(self.telemetry.overlay_text())
+            self.telemetry_label.show()
+            self._telemetry_due = None
+            self.telemetry_timer.start(TELEMETRY_INTERVAL_MS)
+        else:
+            self.telemetry_timer.stop()
+            self.telemetry_label.hide()
+            self.telemetry = None
+        self.export_telemetry_btn.setEnabled(enabled)
+        if self.gantt_view is not None:
+            self.gantt_view.set_telemetry(self.telemetry)
+    
+    def refresh_telemetry(self):
+        """Timer tick: measure how late the Qt event loop ran it, then redraw"""
+        import time
+        if self.telemetry is None:
+            return
+        now = time.perf_counter()
+        if self._telemetry_due is not None:
+            self.telemetry.record_loop_lag(now - self._telemetry_due)
+        self._telemetry_due = now + TELEMETRY_INTERVAL_MS / 1000
+        self.telemetry_label.setText(self.telemetry.overlay_text())
+    
+    def export_telemetry(self):
+        """Save the telemetry summary and per-frame log as JSON"""
+        if self.telemetry is None:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Export Telemetry", "telemetry.json",
+                                              "JSON files (*.json)")
+        if not path:
+            return
+        try:
+            self.telemetry.export_json(path)
+            self.status_label.setText(f"Telemetry saved to {path}")
+        except OSError as e:
+            self.show_error(f"Could not save telemetry: {e}")
+    
+    def change_speed(self, index):
+        """Apply the selected playback speed to the running animation"""
+        if self.playback is None:
+            return
+        _, speed, duration = PLAYBACK_OPTIONS[index]
+        if duration:
+            self.playback.set_duration(duration)
+        else:
+            self.playback.set_speed(speed)
+    
+    def process_colors(self):
+        """Professional color scheme matching the GUI theme"""
         colors = {}
         # Elegant colors that complement the black & gold theme
         color_list = [
@@ -426,14 +643,60 @@ class ModernSchedulerGUI(QMainWindow):
         for i, (pid, _, _) in enumerate(self.processes):
             colors[pid] = color_list[i % len(color_list)]
         colors["Idle"] = "#404040"  # Darker gray for idle periods
+        return colors
+    
+    def show_gantt_view(self):
+        """Open the native QPainter Gantt chart (zoom with wheel, pan by dragging)"""
+        from gui.gantt_widget import GanttWidget
+        
+        if self.gantt_view is None:
+            self.gantt_view = GanttWidget()
+            self.gantt_view.setWindowTitle("FCFS Gantt Chart - Native View")
+            self.gantt_view.resize(1000, 200)
+        self.gantt_view.set_telemetry(self.telemetry)
+        self.gantt_view.set_schedule(self.scheduler.segments_with_times(), self.process_colors())
+        self.gantt_view.show()
+        self.gantt_view.raise_()
+    
+    def run_animation(self):
+        """Run the FCFS animation"""
+        if len(self.processes) < self.min_processes:
+            self.show_error(f"Need at least {self.min_processes} processes!")
+            return
+        if len(self.processes) > self.max_processes:
+            self.show_error(f"The animation shows at most {self.max_processes} processes!")
+            return
+        
+        # Import and run the animation
+        from engine.runner import run
+        from visualization.animate import animate
+        from visualization.playback import PlaybackClock
+        
+        # Convert processes for algorithm
+        processes_for_algo = [(pid, at, bt) for pid, at, bt in self.processes]
+        
+        colors = self.process_colors()
+        
+        # Served from the shared result cache (also used by the batch
+        # paths); on a miss it comes from the incremental scheduler, which
+        # add/remove keep up to date
+        workload = self.current_workload()
+        if self.telemetry is not None:
+            with self.telemetry.scheduling():
+                schedule = run("fcfs", workload, scheduler=self.scheduler.schedule).schedule
+        else:
+            schedule = run("fcfs", workload, scheduler=self.scheduler.schedule).schedule
         
-        # Generate schedule
-        schedule = fcfs(processes_for_algo)
+        # Playback time follows the speed selector, not the schedule length
+        _, speed, duration = PLAYBACK_OPTIONS[self.speed_combo.currentIndex()]
+        self.playback = PlaybackClock(len(schedule), frames_per_second=1000 / 800,
+                                      speed=speed or 1.0, duration=duration)
         
         # Run animation and keep reference
         self.status_label.setText("Running FCFS animation...")
         try:
-            self.animation = animate(schedule, processes_for_algo, colors, interval=800)
+            self.animation = animate(schedule, processes_for_algo, colors, playback=self.playback,
+                                     telemetry=self.telemetry)
             self.status_label.setText("Animation complete! Add more processes or clear to start over.")
         except Exception as e:
             self.show_error(f"Animation error: {str(e)}")
@@ -0,0 +1,44 @@
+"""
+Table model over the GUI's process list
+Rows are read straight from the list on demand, so loading a million
+imported processes costs one model reset instead of a widget item per cell.
+"""
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+HEADERS = ["Process ID", "Arrival Time", "Burst Time", "Status"]
+
+
+class ProcessTableModel(QAbstractTableModel):
+    """Read-only view of [(id, arrival, burst)] tuples"""
+
+    def __init__(self, processes=None, parent=None):
+        super().__init__(parent)
+        self._processes = processes if processes is not None else []
+
+    def set_processes(self, processes):
+        """Show a new (or changed) process list"""
+        self.beginResetModel()
+        self._processes = processes
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._processes)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        column = index.column()
+        if column == 3:
+            return "Ready"
+        value = self._processes[index.row()][column]
+        return value if column == 0 else str(value)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return str(section + 1)
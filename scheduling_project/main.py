@@ -1,8 +1,14 @@
 """
 Modern FCFS CPU Scheduler with PyQt6 GUI
 Entry point for the application
+Pass arguments (e.g. `python main.py run --algo srtf --input w.csv`)
+to use the headless command-line interface instead
 """
+import sys
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        from cli import main as cli_main
+        sys.exit(cli_main())
     from gui.main_window import main
     main()
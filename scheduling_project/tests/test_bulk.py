@@ -0,0 +1,72 @@
+# Workload import: one reader for the GUI and the CLI
+
+import json
+
+import numpy as np
+import pytest
+
+from workload.bulk import load_processes, save_processes
+
+
+def _write(tmp_path, name, content):
+    path = tmp_path / name
+    if name.endswith(".npy"):
+        np.save(path, content)
+    elif name.endswith(".json"):
+        path.write_text(json.dumps(content))
+    else:
+        path.write_text(content)
+    return str(path)
+
+
+def test_round_trip(tmp_path):
+    processes = [("P1", 0, 5, 2), ("P2", 3, 1, 1)]
+    for ext in (".csv", ".json", ".npy"):
+        path = str(tmp_path / ("workload" + ext))
+        save_processes(path, processes)
+        assert load_processes(path) == processes
+
+
+def test_ragged_rows_are_rejected(tmp_path):
+    # Field counts add up to 3 per row, but no row is well formed
+    path = _write(tmp_path, "ragged.csv", "P1,0,5\nP2,1\n7,2,3,4\n")
+    with pytest.raises(ValueError, match="Row 2: expected 3 columns"):
+        load_processes(path)
+
+
+@pytest.mark.parametrize("header", ["name,arrival,burst\n", "Process, Arrival Time, Burst Time\n", ""])
+def test_csv_header_is_optional(tmp_path, header):
+    path = _write(tmp_path, "w.csv", header + "P1,0,3\nP2,+1,2\n")
+    assert load_processes(path) == [("P1", 0, 3), ("P2", 1, 2)]
+
+
+@pytest.mark.parametrize("first", ["P1,1.0,3", "P1,1,3.5", "P1,1.0,3.5"])
+def test_csv_bad_first_row_is_not_a_header(tmp_path, first):
+    path = _write(tmp_path, "w.csv", first + "\nP2,4,2\n")
+    with pytest.raises(ValueError, match="Row 1"):
+        load_processes(path)
+
+
+def test_csv_signed_first_row_is_data(tmp_path):
+    path = _write(tmp_path, "w.csv", "P1,+1,3\nP2,4,2\n")
+    assert load_processes(path) == [("P1", 1, 3), ("P2", 4, 2)]
+
+
+@pytest.mark.parametrize("rows", [[["P1", 0.9, 3]], [["P1", 0, 2.7]]])
+def test_json_floats_are_not_truncated(tmp_path, rows):
+    with pytest.raises(ValueError, match="must be an integer"):
+        load_processes(_write(tmp_path, "floats.json", rows))
+
+
+def test_integral_floats_are_accepted(tmp_path):
+    assert load_processes(_write(tmp_path, "floats.json", [["P1", 1.0, 3.0]])) == [("P1", 1, 3)]
+
+
+def test_npy_floats_are_not_truncated(tmp_path):
+    with pytest.raises(ValueError, match="Row 1: arrival time"):
+        load_processes(_write(tmp_path, "floats.npy", np.array([[0.9, 3.0]])))
+
+
+def test_overflow_is_a_value_error(tmp_path):
+    with pytest.raises(ValueError, match="arrival time"):
+        load_processes(_write(tmp_path, "big.json", [["P1", 2 ** 70, 3]]))
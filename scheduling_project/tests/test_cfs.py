@@ -0,0 +1,32 @@
+# CFS: CPU share follows nice weights; idle time is in the schedule
+
+import pytest
+
+from algorithms.cfs import cfs
+from engine.runner import run
+
+
+def test_cpu_share_follows_weights():
+    # Weights 1024 (nice 0) and 335 (nice 5): about 3:1
+    schedule = cfs([("A", 0, 1000, 0), ("B", 0, 1000, 5)])
+    window = schedule[:600]
+    share = window.count("A") / window.count("B")
+    assert share == pytest.approx(1024 / 335, rel=0.1)
+
+
+def test_equal_nice_shares_equally():
+    window = cfs([("A", 0, 100), ("B", 0, 100)])[:60]
+    assert window.count("A") == window.count("B")
+
+
+def test_idle_gap_is_scheduled():
+    processes = [("P1", 0, 2), ("P2", 10, 2)]
+    result = run("cfs", processes, use_cache=False)
+    assert result.schedule == ["P1", "P1"] + ["Idle"] * 8 + ["P2", "P2"]
+    assert result.metrics["processes"]["P2"] == {"ct": 12, "tat": 2, "wt": 0, "rt": 0}
+    assert result.metrics["avg_wt"] == 0
+
+
+def test_bad_nice_is_rejected():
+    with pytest.raises(ValueError):
+        cfs([("A", 0, 1, 20)])
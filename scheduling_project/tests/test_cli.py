@@ -0,0 +1,78 @@
+# Headless CLI: workloads are validated like in the GUI
+
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from cli import main
+
+
+def _run(tmp_path, rows, *extra):
+    path = tmp_path / "workload.csv"
+    path.write_text("".join(row + "\n" for row in rows))
+    out = io.StringIO()
+    args = ["run", "--input", str(path), *extra]
+    if "--algo" not in extra:
+        args += ["--algo", "fcfs"]
+    return main(args, out=out), out.getvalue()
+
+
+def test_valid_workload(tmp_path):
+    code, out = _run(tmp_path, ["name,arrival,burst", "P1,0,5", "P2,1,3"])
+    assert code == 0
+    assert "P2: CT=8 | TAT=7 | WT=4 | RT=4" in out
+
+
+def test_duplicate_id_is_rejected(tmp_path, capsys):
+    code, out = _run(tmp_path, ["P1,0,5", "P1,1,3"])
+    assert code == 1 and out == ""
+    assert "already exists" in capsys.readouterr().err
+
+
+def test_negative_burst_is_rejected(tmp_path, capsys):
+    code, _ = _run(tmp_path, ["P1,0,5", "P2,2,-2"])
+    assert code == 1
+    assert "Row 2: burst time must be > 0" in capsys.readouterr().err
+
+
+def test_negative_arrival_is_rejected(tmp_path, capsys):
+    code, _ = _run(tmp_path, ["P1,-1,5"])
+    assert code == 1
+    assert "arrival time" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("algorithm", ["sjf", "srtf", "round_robin"])
+def test_idle_gap_keeps_real_times(tmp_path, algorithm):
+    code, out = _run(tmp_path, ["P1,0,2", "P2,10,2"], "--algo", algorithm, "--format", "csv")
+    assert code == 0
+    lines = out.splitlines()
+    assert lines[1:4] == ["P1,0,2", "Idle,2,10", "P2,10,12"]
+    assert "P2,12,2,0,0" in lines
+
+
+def test_summary_on_idle_gap(tmp_path):
+    code, out = _run(tmp_path, ["P1,0,2", "P2,10,2"], "--algo", "sjf", "--summary",
+                     "--format", "json")
+    summary = json.loads(out)
+    assert code == 0
+    assert summary["tat"]["min"] == 2 and summary["wt"]["max"] == 0
+
+
+def test_priority_needs_its_column(tmp_path, capsys):
+    code, _ = _run(tmp_path, ["P1,0,5", "P2,1,3"], "--algo", "priority")
+    assert code == 1
+    assert "priority column" in capsys.readouterr().err
+
+
+def test_csv_run_does_not_import_numpy(tmp_path):
+    path = tmp_path / "workload.csv"
+    path.write_text("P1,0,5\nP2,1,3\n")
+    script = ("import sys, io, cli; "
+              f"code = cli.main(['run', '--algo', 'sjf', '--input', {str(path)!r}], out=io.StringIO()); "
+              "sys.exit(code or ('numpy' in sys.modules) * 3)")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    assert subprocess.run([sys.executable, "-c", script], cwd=root).returncode == 0
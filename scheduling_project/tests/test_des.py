@@ -0,0 +1,42 @@
+# Event-driven simulation: input checks and agreement with algorithms/
+
+import random
+
+import pytest
+
+from engine.des import POLICIES, simulate, to_schedule
+from engine.runner import ALGORITHMS
+
+JOBS = [("A", 0, [3, ("disk", 2), 2]), ("B", 1, [2, ("disk", 4), 1])]
+
+
+def test_device_servers():
+    result = simulate(JOBS, "fcfs", devices={"disk": 2})
+    assert result.devices["disk"]["served"] == 2
+
+
+@pytest.mark.parametrize("servers", [0, -1, 1.5])
+def test_device_needs_positive_servers(servers):
+    with pytest.raises(ValueError, match="disk"):
+        simulate(JOBS, "fcfs", devices={"disk": servers})
+
+
+def _workload(seed, algorithm):
+    rng = random.Random(seed)
+    processes = []
+    for i in range(rng.randint(1, 12)):
+        process = (f"P{i}", rng.randint(0, 30), rng.randint(1, 6))
+        if algorithm == "priority":
+            process += (rng.randint(1, 4),)
+        processes.append(process)
+    # FCFSPolicy goes by arrival, algorithms/fcfs.py by input order
+    return sorted(processes, key=lambda p: p[1])
+
+
+@pytest.mark.parametrize("algorithm", sorted(POLICIES))
+def test_matches_algorithms(algorithm):
+    for seed in range(100):
+        processes = _workload(seed, algorithm)
+        expected = [n for n in ALGORITHMS[algorithm](processes) if n != "Idle"]
+        segments = simulate(processes, algorithm, quantum=2).segments
+        assert [n for n in to_schedule(segments) if n != "Idle"] == expected
@@ -0,0 +1,58 @@
+# IncrementalScheduler must match the reference algorithms after any edit
+
+import random
+
+import pytest
+
+from engine.incremental import IncrementalScheduler
+from engine.runner import ALGORITHMS
+
+ALGORITHM_NAMES = ["fcfs", "sjf", "srtf", "priority", "round_robin"]
+
+
+def _process(rng, name, algorithm):
+    process = (name, rng.randint(0, 60), rng.randint(1, 6))
+    if algorithm == "priority":
+        process += (rng.randint(1, 4),)
+    return process
+
+
+def _reference(algorithm, processes, quantum):
+    if algorithm == "round_robin":
+        return ALGORITHMS[algorithm](list(processes), quantum=quantum)
+    return ALGORITHMS[algorithm](list(processes))
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHM_NAMES)
+@pytest.mark.parametrize("seed", range(5))
+def test_random_edits_match_reference(algorithm, seed):
+    rng = random.Random(seed)
+    quantum = rng.randint(1, 4)
+    names = iter(f"P{i}" for i in range(10 ** 6))
+    processes = [_process(rng, next(names), algorithm) for _ in range(40)]
+    # Small checkpoint interval so edits resume from and splice at checkpoints
+    scheduler = IncrementalScheduler(algorithm, processes, quantum=quantum, checkpoint_every=4)
+
+    for step in range(60):
+        action = rng.choice(["add", "remove", "replace"]) if processes else "add"
+        if action == "add":
+            process = _process(rng, next(names), algorithm)
+            processes.append(process)
+            scheduler.add_process(process)
+        elif action == "remove":
+            process = processes.pop(rng.randrange(len(processes)))
+            scheduler.remove_process(process[0])
+        else:
+            position = rng.randrange(len(processes))
+            old = processes[position]
+            new = _process(rng, rng.choice([old[0], next(names)]), algorithm)
+            scheduler.replace_process(old[0], new)
+            if algorithm == "fcfs":
+                processes[position] = new
+            else:
+                # Re-admitted after equal keys, like add_process
+                del processes[position]
+                processes.append(new)
+
+        expected = _reference(algorithm, processes, quantum)
+        assert scheduler.schedule() == expected, f"step {step}: {action}"
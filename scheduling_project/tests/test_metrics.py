@@ -0,0 +1,44 @@
+# Metrics come from the schedule index, so idle time must be in the schedule
+
+import random
+
+import pytest
+
+from engine.des import simulate
+from engine.runner import run
+
+POLICIES = ["fcfs", "sjf", "srtf", "priority", "round_robin"]
+
+
+def _workload(rng, algorithm):
+    processes = []
+    for i in range(rng.randint(1, 30)):
+        # Long gaps between some arrivals leave the CPU idle
+        process = (f"P{i}", rng.choice([rng.randint(0, 10), rng.randint(0, 200)]),
+                   rng.randint(1, 6))
+        if algorithm == "priority":
+            process += (rng.randint(1, 4),)
+        processes.append(process)
+    return sorted(processes, key=lambda p: p[1])
+
+
+@pytest.mark.parametrize("algorithm", POLICIES)
+def test_gap_between_arrivals(algorithm):
+    processes = [("P1", 0, 1, 1), ("P2", 10, 1, 1)]
+    if algorithm != "priority":
+        processes = [p[:3] for p in processes]
+    result = run(algorithm, processes, use_cache=False)
+    assert result.schedule == ["P1"] + ["Idle"] * 9 + ["P2"]
+    assert result.metrics["processes"]["P2"] == {"ct": 11, "tat": 1, "wt": 0, "rt": 0}
+
+
+@pytest.mark.parametrize("algorithm", POLICIES)
+def test_matches_event_driven_times(algorithm):
+    # engine.des keeps real timestamps, so its metrics are the reference
+    rng = random.Random(algorithm)
+    for _ in range(100):
+        processes = _workload(rng, algorithm)
+        metrics = run(algorithm, processes, use_cache=False).metrics
+        expected = simulate(processes, algorithm, quantum=2, record=False).metrics
+        for name, m in metrics["processes"].items():
+            assert m == {k: expected["processes"][name][k] for k in m}, name
@@ -0,0 +1,40 @@
+# Monte Carlo comparison: reproducible and honest about early stopping
+
+import numpy as np
+
+import analysis.montecarlo as montecarlo
+
+SPEC = {"processes": [10, 30], "interarrival": ["exponential", 4.0],
+        "burst": ["lognormal", 1.2, 0.8]}
+
+
+def test_result_does_not_depend_on_workers():
+    runs = [montecarlo.compare(SPEC, ["sjf", "srtf", "round_robin:4"], seed=3, workers=w,
+                               max_replications=60)
+            for w in (1, 2)]
+    assert runs[0] == runs[1]
+
+
+def test_clear_difference_stops_early():
+    result = montecarlo.compare(SPEC, ["sjf", "round_robin:2"], seed=1, workers=1,
+                                batch_size=100, max_replications=2000)
+    assert result.settled and result.replications < 2000
+    assert result.ranking["mean_wt"] == ["sjf", "round_robin:2"]
+    _, _, high = result.differences[("sjf", "round_robin:2")]["mean_wt"]
+    assert high < 0
+
+
+def test_false_settle_rate_with_repeated_looks(monkeypatch):
+    # Two candidates with the same mean: settling means a false difference
+    def null_replicate(job):
+        _, seed, index, candidates, _ = job
+        rng = np.random.default_rng([seed, index])
+        return [tuple(rng.normal(0, 1, 2)) for _ in candidates]
+
+    monkeypatch.setattr(montecarlo, "_replicate", null_replicate)
+    trials = 200
+    settled = sum(
+        montecarlo.compare({}, ["sjf", "srtf"], seed=seed, workers=1, max_replications=400,
+                           metrics=("mean_wt",)).settled
+        for seed in range(trials))
+    assert settled / trials <= 0.05
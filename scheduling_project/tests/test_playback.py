@@ -0,0 +1,46 @@
+# Playback: cached frames keep hitting on every loop, scrubbing stays in range
+
+from visualization.frame_cache import FrameCache
+from visualization.playback import PlaybackClock
+
+FRAME_BYTES = 7_700_000  # one full-figure Agg snapshot
+
+
+def _loop(cache, frames):
+    for frame in range(frames):
+        if cache.get(frame) is None:
+            cache.put(frame, object(), FRAME_BYTES)
+
+
+def test_loops_longer_than_the_budget_still_hit():
+    cache = FrameCache()
+    capacity = cache.max_bytes // FRAME_BYTES
+    _loop(cache, 90)
+    assert cache.hits == 0 and len(cache) == capacity
+    _loop(cache, 90)
+    assert cache.hits == capacity
+    assert cache.misses == 90 + 90 - capacity
+    assert cache.nbytes <= cache.max_bytes
+
+
+def test_new_token_drops_frames():
+    cache = FrameCache()
+    cache.validate("a")
+    _loop(cache, 3)
+    assert not cache.validate("a")
+    assert cache.validate("b") and len(cache) == 0 and cache.nbytes == 0
+
+
+def test_step_scrubs_back_and_forth():
+    now = [0.0]
+    clock = PlaybackClock(10, frames_per_second=1, clock=lambda: now[0])
+    now[0] = 5.5
+    clock.pause()
+    clock.step(-1)
+    assert clock.frame() == 4
+    clock.step(-10)
+    assert clock.frame() == 0
+    clock.step(20)
+    assert clock.frame() == 9
+    now[0] = 100.0
+    assert clock.frame() == 9  # still paused
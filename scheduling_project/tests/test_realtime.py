@@ -0,0 +1,61 @@
+# Schedulability analysis must agree with simulating the task set
+
+import random
+from fractions import Fraction
+
+from algorithms.realtime import hyperperiod, iter_periodic_segments
+from analysis.schedulability import analyze
+
+
+def _task_set(seed):
+    rng = random.Random(seed)
+    tasks = []
+    for i in range(rng.randint(1, 4)):
+        period = rng.randint(2, 12)
+        wcet = rng.randint(1, max(1, period // 2))
+        # Implicit, constrained and arbitrary deadlines
+        deadline = rng.choice([period, rng.randint(wcet, period), rng.randint(period, 2 * period)])
+        tasks.append((f"T{i}", period, wcet, deadline))
+    return tasks
+
+
+def _misses(tasks, policy):
+    # With U <= 1 and synchronous release, any miss shows up by H + max deadline
+    horizon = hyperperiod(tasks) + max(task[3] for task in tasks)
+    misses = []
+    for _ in iter_periodic_segments(tasks, policy, horizon, misses=misses):
+        pass
+    return misses
+
+
+def _feasible_sets(count):
+    for seed in range(count):
+        tasks = _task_set(seed)
+        if sum(Fraction(wcet, period) for _, period, wcet, _ in tasks) <= 1:
+            yield tasks
+
+
+def test_overloaded_sets_are_rejected():
+    for seed in range(1000):
+        tasks = _task_set(seed)
+        if sum(Fraction(wcet, period) for _, period, wcet, _ in tasks) > 1:
+            for policy in ("edf", "rm"):
+                assert analyze(tasks, policy).schedulable is False
+
+
+def test_edf_analysis_matches_simulation():
+    outcomes = set()
+    for tasks in _feasible_sets(1000):
+        schedulable = analyze(tasks, "edf").schedulable
+        assert schedulable == (not _misses(tasks, "edf")), tasks
+        outcomes.add(schedulable)
+    assert outcomes == {True, False}
+
+
+def test_rm_acceptance_is_safe():
+    accepted = 0
+    for tasks in _feasible_sets(1000):
+        if analyze(tasks, "rm").schedulable:
+            assert not _misses(tasks, "rm"), tasks
+            accepted += 1
+    assert accepted
@@ -0,0 +1,31 @@
+# Parallel runs through shared memory must not leak blocks
+
+import os
+
+import pytest
+
+from algorithms.fcfs import fcfs
+from engine.shm import run_parallel
+
+SHM_DIR = "/dev/shm"
+PROCESSES = [("A", 0, 3), ("B", 1, 2)]
+
+pytestmark = pytest.mark.skipif(not os.path.isdir(SHM_DIR), reason="needs /dev/shm")
+
+
+def test_results_match_and_are_released():
+    before = set(os.listdir(SHM_DIR))
+    results = run_parallel([("fcfs", PROCESSES, None)] * 4, workers=2)
+    assert [r.schedule() for r in results] == [fcfs(PROCESSES)] * 4
+    for result in results:
+        result.close()
+    assert set(os.listdir(SHM_DIR)) <= before
+
+
+def test_failed_job_releases_finished_blocks():
+    before = set(os.listdir(SHM_DIR))
+    good = ("fcfs", PROCESSES, None)
+    bad = ("priority", PROCESSES, None)  # no priority column
+    with pytest.raises(ValueError, match="priority column"):
+        run_parallel([good] * 3 + [bad] + [good] * 3, workers=2)
+    assert set(os.listdir(SHM_DIR)) <= before
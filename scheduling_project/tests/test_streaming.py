@@ -0,0 +1,81 @@
+# One-pass metrics must agree with compute_metrics and stay bounded
+
+import math
+import random
+
+import pytest
+
+import analysis.streaming as streaming
+from analysis.metrics import compute_metrics, iter_segments
+from engine.runner import ALGORITHMS
+
+
+def _workload(seed, algorithm):
+    rng = random.Random(seed)
+    processes = []
+    for i in range(rng.randint(1, 40)):
+        # Mix of dense arrivals and long gaps so the CPU goes idle
+        arrival = rng.choice([rng.randint(0, 20), rng.randint(0, 300)])
+        process = (f"P{i}", arrival, rng.randint(1, 8))
+        if algorithm == "priority":
+            process += (rng.randint(1, 4),)
+        elif algorithm == "cfs":
+            process += (0,)
+        processes.append(process)
+    return processes
+
+
+@pytest.mark.parametrize("algorithm", sorted(ALGORITHMS))
+def test_matches_compute_metrics(algorithm):
+    for seed in range(50):
+        processes = _workload(seed, algorithm)
+        schedule = ALGORITHMS[algorithm](processes)
+        expected = compute_metrics(schedule, processes)
+        ordered = sorted(processes, key=lambda p: p[1])
+        summary = streaming.stream_schedule_metrics(
+            iter_segments(schedule), ordered, relative_error=1e-9).summary()
+        assert summary["wt"]["count"] == len(processes)
+        assert summary["wt"]["mean"] == pytest.approx(expected["avg_wt"])
+        assert summary["tat"]["mean"] == pytest.approx(expected["avg_tat"])
+        for metric in ("tat", "wt"):
+            values = [m[metric] for m in expected["processes"].values()]
+            for p in (50, 95, 99):
+                assert summary[metric][f"p{p}"] == pytest.approx(_nearest_rank(values, p))
+
+
+def _nearest_rank(values, p):
+    ordered = sorted(values)
+    return ordered[max(math.ceil(p / 100 * len(ordered)), 1) - 1]
+
+
+def test_percentiles_use_nearest_rank():
+    summary = streaming.MetricSummary(relative_error=1e-9)
+    for x in range(1, 11):
+        summary.add(x)
+    result = summary.as_dict()
+    assert result["p50"] == pytest.approx(5)
+    assert result["p95"] == pytest.approx(10)
+    assert result["p99"] == pytest.approx(10)
+
+
+def test_percentiles_stay_within_observed_range():
+    summary = streaming.MetricSummary(relative_error=0.1)
+    for x in (7, 7, 7):
+        summary.add(x)
+    result = summary.as_dict()
+    assert result["p50"] == result["p99"] == 7
+
+
+def test_unknown_names_do_not_admit_future_arrivals(monkeypatch):
+    peak = []
+
+    class Recording(streaming.StreamingMetrics):
+        def arrive(self, name, arrival, burst):
+            super().arrive(name, arrival, burst)
+            peak.append(self.active_count)
+
+    monkeypatch.setattr(streaming, "StreamingMetrics", Recording)
+    processes = [(f"P{i}", i * 10, 1) for i in range(1000)]
+    segments = [("P0", 0, 1)] + [("ghost", t, t + 1) for t in range(1, 6)]
+    streaming.stream_schedule_metrics(segments, processes)
+    assert max(peak) == 1
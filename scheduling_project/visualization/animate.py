@@ -1,9 +1,15 @@
+import inspect
+
 import matplotlib
 matplotlib.use('Qt5Agg')  # Use Qt5Agg backend for compatibility with PyQt6
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import matplotlib.font_manager as fm
 
+from analysis.schedule_index import ScheduleIndex
+from visualization.frame_cache import FrameCache
+from visualization.playback import PlaybackClock
+
 # Set Times New Roman font with fallback for professional look
 try:
     available_fonts = [f.name for f in fm.fontManager.ttflist]
@@ -16,10 +22,92 @@ except:
 
 plt.rcParams['font.size'] = 12
 
-def animate(schedule, processes, colors, interval=800):
+
+class CachedFuncAnimation(animation.FuncAnimation):
+    """
+    FuncAnimation that replays frames it has already rendered
+    The first time a frame is shown it is drawn normally and snapshotted
+    into frame_cache; repeat loops and backward seeks restore the
+    snapshot instead of calling func again. Overlay artists (animated,
+    so left out of snapshots) are drawn fresh on top of every frame.
+    cache_token() = value that changes when snapshots become invalid
+    """
+
+    def __init__(self, fig, func, frame_cache, cache_token, overlays=(),
+                 refresh_overlays=None, telemetry=None, **kwargs):
+        self.frame_cache = frame_cache
+        self.cache_token = cache_token
+        self.overlays = list(overlays)
+        self.refresh_overlays = refresh_overlays
+        self.telemetry = telemetry
+        self._shown = None
+        for artist in self.overlays:
+            artist.set_animated(True)
+        super().__init__(fig, func, **kwargs)
+
+    @staticmethod
+    def supported():
+        """
+        True if matplotlib still has the private hooks overridden here
+        (Animation._draw_next_frame / _draw_frame as of matplotlib 3.11);
+        animate() falls back to a plain FuncAnimation otherwise
+        """
+        try:
+            next_frame = inspect.signature(animation.FuncAnimation._draw_next_frame)
+            draw_frame = inspect.signature(animation.FuncAnimation._draw_frame)
+        except (AttributeError, TypeError, ValueError):
+            return False
+        return (list(next_frame.parameters) == ["self", "framedata", "blit"]
+                and list(draw_frame.parameters) == ["self", "framedata"])
+
+    def _draw_next_frame(self, framedata, blit):
+        canvas = self._fig.canvas
+        if not hasattr(canvas, "copy_from_bbox"):
+            return super()._draw_next_frame(framedata, blit)
+        if self.frame_cache.validate(self.cache_token()):
+            self._shown = None  # schedule or window size changed
+        if framedata == self._shown:
+            return  # clock has not advanced: nothing new to show
+
+        telemetry = self.telemetry
+        if telemetry is not None:
+            telemetry.frame_start()
+        if self.frame_cache.restore(framedata, canvas):
+            self._draw_overlays()
+            if telemetry is not None:
+                telemetry.frame_end(framedata, artists=len(self.overlays))
+        else:
+            self._draw_frame(framedata)
+            canvas.draw()  # synchronous, so the snapshot is this frame
+            self.frame_cache.store(framedata, canvas, self._fig.bbox)
+            self._draw_overlays()
+        self._shown = framedata
+
+    def _draw_overlays(self):
+        fig = self._fig
+        if self.refresh_overlays is not None:
+            self.refresh_overlays()
+        for artist in self.overlays:
+            if artist.get_visible():
+                fig.draw_artist(artist)
+        fig.canvas.blit(fig.bbox)
+
+
+def animate(schedule, processes, colors, interval=800, speed=1.0, duration=None, playback=None,
+            telemetry=None, frame_cache=None):
     """
     Professional animated Gantt chart for FCFS scheduling
     Compatible version without problematic alpha parameters
+    interval = ms per time unit at 1x speed
+    speed / duration = playback speed multiplier or total seconds to fit
+    playback = optional PlaybackClock to control playback from outside
+    telemetry = optional visualization.telemetry.Telemetry; shows an overlay
+    frame_cache = FrameCache for rendered frames (default: a new 256 MB one);
+                  False redraws every frame from scratch, as does a
+                  matplotlib without the hooks the cache relies on
+    Keys in the chart window: space = pause, +/- = speed, r = restart,
+    left/right = step one time unit back/forward (shift: 10),
+    t = toggle the telemetry overlay
     """
     if not schedule:
         print("No schedule to animate!")
@@ -41,7 +129,42 @@ def animate(schedule, processes, colors, interval=800):
     for name, _, _ in processes:
         completion_times[name] = 0
 
+    # Segment index: each frame queries [0, frame + 1) instead of rescanning ticks
+    index = ScheduleIndex.from_schedule(schedule)
+
+    if playback is None:
+        playback = PlaybackClock(len(schedule), frames_per_second=1000 / interval,
+                                 speed=speed, duration=duration)
+    last_drawn = [None]
+
+    cached = frame_cache is not False and CachedFuncAnimation.supported()
+
+    # Telemetry overlay lives on the figure so ax.clear() leaves it alone
+    overlay = None
+    if telemetry is not None:
+        telemetry.reset_frames()
+        telemetry.schedule_length = len(schedule)
+        overlay = fig.text(0.01, 0.99, "", ha='left', va='top', fontsize=10,
+                           family='monospace', color='#90EE90',
+                           bbox=dict(boxstyle="round,pad=0.3", facecolor='#000000',
+                                     edgecolor='#90EE90', linewidth=1))
+
+    def refresh_overlay():
+        if overlay is not None and overlay.get_visible():
+            overlay.set_text(telemetry.overlay_text())
+
     def update(frame):
+        # Frames repeat while waiting for the clock; skip redundant redraws
+        if frame == last_drawn[0]:
+            return
+        if last_drawn[0] is not None and frame < last_drawn[0]:
+            # Playback restarted: forget completions from the previous loop
+            for name in completion_times:
+                completion_times[name] = 0
+        last_drawn[0] = frame
+        if telemetry is not None:
+            telemetry.frame_start()
+
         ax.clear()
         ax.set_facecolor('#1a1a1a')
         
@@ -71,20 +194,13 @@ def animate(schedule, processes, colors, interval=800):
         
         # Build segments up to current frame
         segments = {}
-        for i in range(frame + 1):
-            proc = schedule[i]
-            if proc not in segments:
-                segments[proc] = []
-            
-            # Check if this continues the last segment
-            if segments[proc] and segments[proc][-1][0] + segments[proc][-1][1] == i:
-                segments[proc][-1] = (segments[proc][-1][0], segments[proc][-1][1] + 1)
-            else:
-                segments[proc].append((i, 1))
+        for proc, start, end in index.overlapping(0, frame + 1):
+            end = min(end, frame + 1)
+            segments.setdefault(proc, []).append((start, end - start))
             
             # Update completion time for non-idle processes
             if proc != "Idle" and proc in completion_times:
-                completion_times[proc] = i + 1
+                completion_times[proc] = end
         
         # Draw all segments with simplified styling
         for proc, segs in segments.items():
@@ -179,7 +295,7 @@ def animate(schedule, processes, colors, interval=800):
             if ct > 0:
                 status_color = '#90EE90'  # Light green
                 status_text = "✓ Completed"
-            elif any(proc == name for proc in schedule[:frame+1]):
+            elif index.runs_of(name, 0, frame + 1):
                 status_color = '#FFD700'  # Gold
                 status_text = "⚡ Running"
             else:
@@ -214,10 +330,53 @@ def animate(schedule, processes, colors, interval=800):
                    ha='center', va='center',
                    bbox=dict(boxstyle="round,pad=0.4", facecolor='#1e3d59', 
                            edgecolor='#87CEEB', linewidth=2))
+
+        if not cached:
+            refresh_overlay()
     
-    # Create animation
-    ani = animation.FuncAnimation(fig, update, frames=len(schedule), 
-                                 interval=interval, repeat=True, blit=False)
-    
+    # Create animation driven by the wall-clock playback scheduler
+    if not cached:
+        ani = animation.FuncAnimation(fig, update, frames=playback.frames,
+                                     interval=playback.interval_ms, repeat=True, blit=False,
+                                     cache_frame_data=False)
+    else:
+        # Snapshots depend on the schedule, colors and canvas size
+        schedule_key = hash((tuple(schedule), tuple(map(tuple, processes)),
+                             tuple(sorted(colors.items()))))
+        ani = CachedFuncAnimation(
+            fig, update, frame_cache if frame_cache is not None else FrameCache(),
+            lambda: (schedule_key, fig.canvas.get_width_height(), fig.dpi),
+            overlays=[overlay] if overlay is not None else [],
+            refresh_overlays=refresh_overlay, telemetry=telemetry,
+            frames=playback.frames, interval=playback.interval_ms, repeat=True,
+            blit=False, cache_frame_data=False)
+
+    def apply_rate():
+        ani.event_source.interval = playback.interval_ms
+    playback.on_rate_change = apply_rate
+
+    def on_key(event):
+        if event.key == ' ':
+            playback.toggle_pause()
+        elif event.key in ('+', '='):
+            playback.set_speed(playback.rate / playback.frames_per_second * 2)
+        elif event.key == '-':
+            playback.set_speed(playback.rate / playback.frames_per_second / 2)
+        elif event.key == 'r':
+            playback.seek(0)
+        elif event.key in ('left', 'right', 'shift+left', 'shift+right'):
+            step = 10 if event.key.startswith('shift') else 1
+            playback.step(-step if event.key.endswith('left') else step)
+        elif event.key == 't' and overlay is not None:
+            overlay.set_visible(not overlay.get_visible())
+    fig.canvas.mpl_connect('key_press_event', on_key)
+
+    if telemetry is not None:
+        def on_draw(event):
+            # Frame is on screen: update() plus the canvas render
+            telemetry.frame_end(last_drawn[0], len(ax.get_children()) + len(fig.texts))
+        fig.canvas.mpl_connect('draw_event', on_draw)
+
+    ani.playback = playback
     plt.show()
     return ani
\ No newline at end of file
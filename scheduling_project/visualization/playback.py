@@ -0,0 +1,125 @@
+# Wall-clock playback scheduling for the Gantt animation
+
+import time as _time
+
+
+class PlaybackClock:
+    """
+    Maps wall-clock time to a frame (one frame per simulated time unit)
+    Playback runs at frames_per_second * speed, or fits the whole
+    schedule into duration seconds when one is set. Frames are picked
+    from the clock, so when rendering falls behind the animation skips
+    ahead instead of slowing down.
+    """
+
+    def __init__(self, total_frames, frames_per_second=1.25, speed=1.0,
+                 duration=None, max_fps=30, end_hold=1.0, clock=_time.perf_counter):
+        self.total_frames = total_frames
+        self.frames_per_second = frames_per_second
+        self.speed = speed
+        self.duration = duration
+        self.max_fps = max_fps
+        self.end_hold = end_hold
+        self.on_rate_change = None  # called after speed/duration changes
+        self.dropped_frames = 0
+        self._clock = clock
+        self._paused = False
+        self.restart()
+
+    @property
+    def rate(self):
+        """Simulated time units per wall-clock second"""
+        if self.duration:
+            return self.total_frames / self.duration
+        return self.frames_per_second * self.speed
+
+    @property
+    def interval_ms(self):
+        """Timer interval: never faster than max_fps or one tick per frame"""
+        return max(1000.0 / self.max_fps, 1000.0 / self.rate)
+
+    @property
+    def paused(self):
+        return self._paused
+
+    def restart(self):
+        self._anchor_time = self._clock()
+        self._anchor_pos = 0.0
+
+    def position(self):
+        """Current simulated position (fractional frames)"""
+        if self._paused:
+            return self._anchor_pos
+        return self._anchor_pos + (self._clock() - self._anchor_time) * self.rate
+
+    def frame(self):
+        return max(0, min(int(self.position()), self.total_frames - 1))
+
+    def seek(self, frame):
+        self._rebase(float(frame))
+
+    def step(self, frames):
+        """Seek frames forward (negative = back), staying on the schedule"""
+        self.seek(max(0, min(self.frame() + frames, self.total_frames - 1)))
+
+    def set_speed(self, speed):
+        """Play at a multiple of frames_per_second"""
+        position = self.position()
+        self.speed = speed
+        self.duration = None
+        self._rebase(position)
+        self._rate_changed()
+
+    def set_duration(self, seconds):
+        """Fit the whole schedule into the given number of seconds"""
+        position = self.position()
+        self.duration = seconds
+        self._rebase(position)
+        self._rate_changed()
+
+    def pause(self):
+        if not self._paused:
+            self._anchor_pos = self.position()
+            self._paused = True
+
+    def resume(self):
+        if self._paused:
+            self._paused = False
+            self._anchor_time = self._clock()
+
+    def toggle_pause(self):
+        if self._paused:
+            self.resume()
+        else:
+            self.pause()
+
+    def frames(self):
+        """
+        Frame generator for FuncAnimation (pass the method, not a call,
+        so repeat=True restarts playback). Yields the frame that belongs
+        to the current wall-clock time on every timer tick.
+        """
+        self.restart()
+        last = None
+        while True:
+            position = self.position()
+            if position >= self.total_frames:
+                break
+            frame = max(0, int(position))
+            if last is not None and frame > last + 1:
+                self.dropped_frames += frame - last - 1
+            last = frame
+            yield frame
+
+        # Hold the final frame briefly before the animation repeats
+        end = self._clock() + self.end_hold
+        while self._clock() < end:
+            yield self.total_frames - 1
+
+    def _rebase(self, position):
+        self._anchor_time = self._clock()
+        self._anchor_pos = position
+
+    def _rate_changed(self):
+        if self.on_rate_change:
+            self.on_rate_change()
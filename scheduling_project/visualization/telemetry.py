@@ -0,0 +1,153 @@
+# Live render and scheduling telemetry for the GUI and Gantt views
+
+import os
+import sys
+import time as _time
+from collections import deque
+from contextlib import contextmanager
+
+
+def current_rss():
+    """Resident set size of this process in bytes, or None if unknown"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Peak rather than current RSS; kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Telemetry:
+    """
+    Frame timings and run-level numbers for a live overlay
+    Call frame_start() before drawing and frame_end() once the frame is
+    on screen; FPS and render times are taken over the last window
+    frames. Every frame is also kept in a log (up to max_records) for
+    export_json().
+    """
+
+    def __init__(self, window=60, max_records=100000, clock=_time.perf_counter):
+        self.window = window
+        self.max_records = max_records
+        self._clock = clock
+        self._render = deque(maxlen=window)  # seconds per frame
+        self._stamps = deque(maxlen=window)  # frame start times
+        self._start = None
+        self._created = clock()
+        self.frames = 0
+        self.artists = 0
+        self.scheduling_time = None  # seconds for the last scheduling call
+        self.schedule_length = 0
+        self.loop_lag = None  # seconds a timer fired late (Qt event loop)
+        self.records = []
+
+    # ---- recording ----
+
+    def frame_start(self):
+        self._start = self._clock()
+
+    def frame_end(self, frame=None, artists=None):
+        """Finish the frame started by frame_start()"""
+        if self._start is None:
+            return
+        now = self._clock()
+        render = now - self._start
+        self._render.append(render)
+        self._stamps.append(self._start)
+        self._start = None
+        self.frames += 1
+        if artists is not None:
+            self.artists = artists
+        if len(self.records) < self.max_records:
+            self.records.append({
+                "t": now - self._created,
+                "frame": frame,
+                "render_ms": render * 1000,
+                "artists": self.artists,
+            })
+
+    @contextmanager
+    def scheduling(self, schedule_length=None):
+        """Time a scheduling call: with telemetry.scheduling(): ..."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.scheduling_time = self._clock() - start
+            if schedule_length is not None:
+                self.schedule_length = schedule_length
+
+    def record_loop_lag(self, seconds):
+        self.loop_lag = max(seconds, 0.0)
+
+    def reset_frames(self):
+        """Forget frame timings (e.g. when a new animation starts)"""
+        self._render.clear()
+        self._stamps.clear()
+        self._start = None
+
+    # ---- reading ----
+
+    @property
+    def fps(self):
+        """Achieved frames per second over the window"""
+        if len(self._stamps) < 2:
+            return 0.0
+        span = self._stamps[-1] - self._stamps[0]
+        return (len(self._stamps) - 1) / span if span > 0 else 0.0
+
+    @property
+    def render_ms(self):
+        """(last, mean, max) render time in ms over the window"""
+        if not self._render:
+            return (0.0, 0.0, 0.0)
+        return (self._render[-1] * 1000, sum(self._render) / len(self._render) * 1000,
+                max(self._render) * 1000)
+
+    def snapshot(self):
+        last, mean, worst = self.render_ms
+        rss = current_rss()
+        return {
+            "frames": self.frames,
+            "fps": self.fps,
+            "render_ms_last": last,
+            "render_ms_mean": mean,
+            "render_ms_max": worst,
+            "artists": self.artists,
+            "scheduling_ms": None if self.scheduling_time is None else self.scheduling_time * 1000,
+            "schedule_length": self.schedule_length,
+            "loop_lag_ms": None if self.loop_lag is None else self.loop_lag * 1000,
+            "rss_mb": None if rss is None else rss / 2 ** 20,
+        }
+
+    def overlay_text(self):
+        s = self.snapshot()
+        lines = [
+            f"FPS {s['fps']:.1f} | frame {s['render_ms_last']:.1f} ms "
+            f"(avg {s['render_ms_mean']:.1f}, max {s['render_ms_max']:.1f})",
+            f"Artists {s['artists']} | schedule {s['schedule_length']} units",
+        ]
+        extra = []
+        if s["scheduling_ms"] is not None:
+            extra.append(f"scheduling {s['scheduling_ms']:.2f} ms")
+        if s["loop_lag_ms"] is not None:
+            extra.append(f"loop lag {s['loop_lag_ms']:.1f} ms")
+        if s["rss_mb"] is not None:
+            extra.append(f"RSS {s['rss_mb']:.1f} MB")
+        if extra:
+            lines.append(" | ".join(extra))
+        return "\n".join(lines)
+
+    def report(self):
+        return {"summary": self.snapshot(), "frames": self.records}
+
+    def export_json(self, path):
+        """Write the summary and per-frame log to a JSON file"""
+        from engine.instrument import export_json
+        export_json(self.report(), path)
@@ -0,0 +1 @@
+# Workload package for importing and exporting process sets
\ No newline at end of file
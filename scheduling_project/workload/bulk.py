@@ -0,0 +1,293 @@
+# Vectorized bulk import, validation and export of process sets
+# CSV and JSON are handled with whole-column builtins; numpy is only
+# imported for .npy files, so headless callers start fast
+
+import csv
+import json
+import operator
+import os
+from collections import namedtuple
+from itertools import repeat
+
+# Column-oriented process set: names is a list of str, the rest lists of
+# int (priority is None when the workload has no priority column)
+ProcessArrays = namedtuple("ProcessArrays", ["names", "arrival", "burst", "priority"])
+
+FORMATS = (".csv", ".json", ".npy")
+
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def _format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"Unsupported workload format: {ext or path}")
+    return ext
+
+
+def _is_int(value):
+    """True if value is an integer (or integral float) that fits in int64"""
+    try:
+        if isinstance(value, str):
+            n = int(value)
+        elif isinstance(value, float):
+            if not value.is_integer():
+                return False
+            n = int(value)
+        else:
+            n = operator.index(value)
+    except (ValueError, TypeError, OverflowError):
+        return False
+    return INT64_MIN <= n <= INT64_MAX
+
+
+def _bad_value(values, label):
+    """Slow path only to point at the bad row"""
+    for i, v in enumerate(values):
+        if not _is_int(v):
+            return ValueError(f"Row {i + 1}: {label} must be an integer, got {v!r}")
+    return ValueError(f"{label} column could not be read")
+
+
+def _int_column(values, label):
+    """
+    Column of ints from CSV strings, JSON numbers or a numpy array
+    No silent truncation: 2.7 is an error, 3.0 is 3
+    """
+    if hasattr(values, "dtype"):
+        values = values.tolist()  # numpy scalars become int / float
+    types = set(map(type, values))
+    try:
+        if types <= {int}:
+            column = values if isinstance(values, list) else list(values)
+        elif types <= {str, int}:
+            column = list(map(int, values))
+        elif types <= {int, float} and all(
+                v.is_integer() for v in values if type(v) is float):
+            column = list(map(int, values))
+        else:
+            raise ValueError
+    except (ValueError, TypeError, OverflowError):
+        raise _bad_value(values, label) from None
+    if column and (min(column) < INT64_MIN or max(column) > INT64_MAX):
+        raise _bad_value(values, label)
+    return column
+
+
+def _from_columns(names, columns):
+    if len(columns) < 2:
+        raise ValueError("Expected name, arrival and burst columns")
+    arrival = _int_column(columns[0], "arrival time")
+    burst = _int_column(columns[1], "burst time")
+    priority = _int_column(columns[2], "priority") if len(columns) > 2 else None
+    if not isinstance(names, list) or set(map(type, names)) - {str}:
+        names = list(map(str, names))
+    return ProcessArrays(list(map(str.strip, names)), arrival, burst, priority)
+
+
+def _is_number(text):
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_header(row):
+    """
+    A name,arrival,burst[,priority] header, or a first row whose arrival
+    and burst cells are both labels rather than numbers. Anything else is
+    data, so a malformed first row is reported instead of dropped.
+    """
+    cells = [c.strip().lower() for c in row]
+    if cells == ["name", "arrival", "burst", "priority"][:len(cells)]:
+        return True
+    return len(cells) > 2 and not _is_number(cells[1]) and not _is_number(cells[2])
+
+
+def _read_csv(path):
+    """name,arrival,burst[,priority] rows; optional header and # comments"""
+    with open(path, newline="") as f:
+        text = f.read()
+    if '"' in text:
+        # Quoted fields need the real CSV parser
+        rows = [r for r in csv.reader(text.splitlines()) if r and not r[0].startswith("#")]
+    else:
+        rows = None
+        lines = list(filter(str.strip, text.splitlines()))
+        if "#" in text:
+            lines = [l for l in lines if not l.startswith("#")]
+    first = rows[0] if rows is not None else (lines[0].split(",") if lines else [])
+    header = _is_header(first)
+
+    if rows is not None:
+        rows = rows[1:] if header else rows
+        width = len(rows[0]) if rows else 3
+        if any(len(r) != width for r in rows):
+            raise ValueError("All rows must have the same number of columns")
+        columns = list(zip(*rows)) if rows else [()] * width
+        return _from_columns(columns[0], columns[1:])
+
+    lines = lines[1:] if header else lines
+    width = len(first)
+    # Every line needs width - 1 commas; a matching total is not enough,
+    # since short and long rows can cancel out
+    if set(map(str.count, lines, repeat(","))) - {width - 1}:
+        for i, line in enumerate(lines):
+            if line.count(",") != width - 1:
+                raise ValueError(f"Row {i + 1}: expected {width} columns")
+    # One split over the whole file, then strided column views
+    flat = ",".join(lines).split(",") if lines else []
+    return _from_columns(flat[0::width], [flat[k::width] for k in range(1, width)])
+
+
+def _read_json(path):
+    """
+    List of [name, arrival, burst(, priority)] rows, list of objects with
+    those keys, or one object of columns {"name": [...], "arrival": [...]}
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        keys = [k for k in ("arrival", "burst", "priority") if k in data]
+        return _from_columns(data["name"], [data[k] for k in keys])
+    if data and isinstance(data[0], dict):
+        keys = [k for k in ("arrival", "burst", "priority") if k in data[0]]
+        return _from_columns([d["name"] for d in data], [[d[k] for d in data] for k in keys])
+    width = len(data[0]) if data else 3
+    if any(len(row) != width for row in data):
+        raise ValueError("All rows must have the same number of columns")
+    # Per-column comprehensions are much faster than zip(*data) on big lists
+    columns = [[row[k] for row in data] for k in range(width)]
+    return _from_columns(columns[0], columns[1:])
+
+
+def _read_npy(path):
+    """
+    Structured array with name/arrival/burst(/priority) fields, or a 2-D
+    array of arrival, burst(, priority) columns named P1..Pn
+    """
+    import numpy as np
+
+    data = np.load(path, allow_pickle=False)
+    if data.dtype.names:
+        keys = [k for k in ("arrival", "burst", "priority") if k in data.dtype.names]
+        names = data["name"].tolist() if "name" in data.dtype.names else None
+        columns = [data[k] for k in keys]
+    else:
+        data = np.atleast_2d(data)
+        names = None
+        columns = [data[:, k] for k in range(data.shape[1])]
+    if names is None:
+        names = [f"P{i + 1}" for i in range(len(columns[0]))]
+    return _from_columns(names, columns)
+
+
+def read_processes(path):
+    """
+    Load a whole process set from .csv, .json or .npy as columns
+    Returns: ProcessArrays (not yet validated; see validate())
+    """
+    ext = _format(path)
+    if ext == ".csv":
+        return _read_csv(path)
+    if ext == ".json":
+        return _read_json(path)
+    return _read_npy(path)
+
+
+def validate(arrays, existing=()):
+    """
+    Check unique IDs (also against existing IDs), arrival >= 0 and burst > 0
+    Raises: ValueError naming the first offending row
+    """
+    names = arrays.names
+    if not all(names):
+        raise ValueError(f"Row {names.index('') + 1}: process ID is empty")
+
+    # min() runs at C speed; the index is only searched for on failure
+    if names and min(arrays.arrival) < 0:
+        row = next(i for i, v in enumerate(arrays.arrival) if v < 0)
+        raise ValueError(f"Row {row + 1}: arrival time must be ≥ 0")
+    if names and min(arrays.burst) <= 0:
+        row = next(i for i, v in enumerate(arrays.burst) if v <= 0)
+        raise ValueError(f"Row {row + 1}: burst time must be > 0")
+
+    unique = set(names)
+    if len(unique) != len(names):
+        seen = set()
+        for i, name in enumerate(names):
+            if name in seen:
+                raise ValueError(f"Row {i + 1}: process {name} already exists!")
+            seen.add(name)
+    clash = unique.intersection(existing)
+    if clash:
+        name = next(n for n in names if n in clash)
+        raise ValueError(f"Row {names.index(name) + 1}: process {name} already exists!")
+
+
+def load_processes(path, existing=()):
+    """
+    Read and validate a process set in one go
+    Returns: [(name, arrival, burst)] or [(name, arrival, burst, priority)]
+    """
+    arrays = read_processes(path)
+    validate(arrays, existing)
+    return to_processes(arrays)
+
+
+def to_processes(arrays):
+    columns = [arrays.names, arrays.arrival, arrays.burst]
+    if arrays.priority is not None:
+        columns.append(arrays.priority)
+    return list(zip(*columns))
+
+
+def from_processes(processes):
+    """Columns from [(name, arrival, burst[, priority])] tuples"""
+    if not processes:
+        return ProcessArrays([], [], [], None)
+    width = len(processes[0])
+    columns = [[p[k] for p in processes] for k in range(width)]
+    return _from_columns(columns[0], columns[1:])
+
+
+def save_processes(path, processes):
+    """
+    Write processes to .csv, .json or .npy
+    processes = [(name, arrival, burst[, priority])] or ProcessArrays
+    """
+    ext = _format(path)
+    arrays = processes if isinstance(processes, ProcessArrays) else from_processes(processes)
+    keys = ["arrival", "burst"] + (["priority"] if arrays.priority is not None else [])
+    columns = [getattr(arrays, k) for k in keys]
+
+    if ext == ".npy":
+        import numpy as np
+
+        width = max((len(n) for n in arrays.names), default=1)
+        table = np.empty(len(arrays.names),
+                         dtype=[("name", f"U{width}")] + [(k, np.int64) for k in keys])
+        table["name"] = arrays.names
+        for k, column in zip(keys, columns):
+            table[k] = column
+        np.save(path, table, allow_pickle=False)
+        return
+
+    if ext == ".json":
+        with open(path, "w") as f:
+            f.write(json.dumps([list(row) for row in zip(arrays.names, *columns)]))
+        return
+
+    if any("," in n or '"' in n for n in arrays.names):
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["name"] + keys)
+            writer.writerows(zip(arrays.names, *columns))
+        return
+    with open(path, "w", newline="") as f:
+        f.write(",".join(["name"] + keys) + "\n")
+        text_columns = [arrays.names] + [map(str, c) for c in columns]
+        f.write("\n".join(map(",".join, zip(*text_columns))))
+        if arrays.names:
+            f.write("\n")
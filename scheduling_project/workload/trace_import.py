@@ -0,0 +1,180 @@
+# Streaming importer for ftrace / perf sched text dumps
+
+import mmap
+import re
+
+from analysis.metrics import compute_metrics
+
+# "<comm>-<pid> [cpu] flags timestamp: event: payload" (ftrace) or
+# "<comm> <pid> [cpu] timestamp: sched:event: payload" (perf sched script)
+_EVENT_RE = re.compile(
+    rb"\[(\d+)\]\s+(?:\S+\s+)?(\d+\.\d+):\s+(?:sched:)?(sched_switch|sched_wakeup_new|sched_wakeup):\s*(.*)"
+)
+_SWITCH_KV_RE = re.compile(
+    rb"prev_comm=(.*?) prev_pid=(\d+) .*?prev_state=(\S+) ==> next_comm=(.*?) next_pid=(\d+)"
+)
+_SWITCH_COMPACT_RE = re.compile(rb"(.+?):(\d+) \[\d+\] (\S+) ==> (.+?):(\d+) \[\d+\]")
+_WAKEUP_KV_RE = re.compile(rb"comm=(.*?) pid=(\d+)")
+_WAKEUP_COMPACT_RE = re.compile(rb"(.+?):(\d+) \[\d+\]")
+
+
+def iter_sched_events(path):
+    """
+    Stream scheduler events from a trace file without loading it
+    Yields: ("switch", ts, cpu, prev_pid, prev_comm, prev_state, next_pid, next_comm)
+            ("wakeup", ts, cpu, pid, comm)
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return
+        try:
+            for line in iter(mm.readline, b""):
+                if b"sched_" not in line:
+                    continue
+                m = _EVENT_RE.search(line)
+                if not m:
+                    continue
+                cpu = int(m.group(1))
+                ts = float(m.group(2))
+                event, payload = m.group(3), m.group(4)
+                if event == b"sched_switch":
+                    s = _SWITCH_KV_RE.search(payload) or _SWITCH_COMPACT_RE.search(payload)
+                    if s:
+                        yield ("switch", ts, cpu, int(s.group(2)), _text(s.group(1)),
+                               _text(s.group(3)), int(s.group(5)), _text(s.group(4)))
+                else:
+                    w = _WAKEUP_KV_RE.search(payload) or _WAKEUP_COMPACT_RE.search(payload)
+                    if w:
+                        yield ("wakeup", ts, cpu, int(w.group(2)), _text(w.group(1)))
+        finally:
+            mm.close()
+
+
+def _text(raw):
+    return raw.decode("utf-8", "replace").strip()
+
+
+class TraceWorkload:
+    """
+    Workload and observed schedule reconstructed from a trace
+    processes = [(name, arrival, burst)] in ticks, sorted by arrival
+    observed = {name: {"arrival", "burst", "first_run", "completion"}} in ticks
+    """
+
+    def __init__(self, processes, observed, events, duration):
+        self.processes = processes
+        self.observed = observed
+        self.events = events
+        self.duration = duration
+
+    def observed_metrics(self):
+        """CT, TAT, WT and RT of what the kernel actually did"""
+        per_process = {}
+        for name, o in self.observed.items():
+            tat = o["completion"] - o["arrival"]
+            per_process[name] = {
+                "ct": o["completion"],
+                "tat": tat,
+                "wt": max(0, tat - o["burst"]),
+                "rt": o["first_run"] - o["arrival"],
+            }
+        return per_process
+
+
+def import_trace(path, tick=0.001, cpu=None, on_segment=None):
+    """
+    Rebuild the arrival/burst workload from sched_switch/sched_wakeup events
+    tick = seconds per simulated time unit
+    cpu = only use events from this CPU (None = all CPUs)
+    on_segment(cpu, name, start, end) is called for every observed run
+    Memory use grows with the number of tasks, not the trace size.
+    """
+    tasks = {}        # pid -> [name, arrival_s, runtime_s, first_run_s, last_end_s]
+    running = {}      # cpu -> (pid, since_s)
+    t0 = None
+    t_last = 0.0
+    events = 0
+
+    def task(pid, comm, ts):
+        entry = tasks.get(pid)
+        if entry is None:
+            entry = tasks[pid] = [f"{comm}-{pid}", ts, 0.0, None, None]
+        return entry
+
+    for ev in iter_sched_events(path):
+        ts, ev_cpu = ev[1], ev[2]
+        if cpu is not None and ev_cpu != cpu:
+            continue
+        if t0 is None:
+            t0 = ts
+        t_last = ts
+        events += 1
+
+        if ev[0] == "wakeup":
+            if ev[3] != 0:
+                task(ev[3], ev[4], ts)
+            continue
+
+        _, _, _, prev_pid, prev_comm, _, next_pid, next_comm = ev
+        current = running.pop(ev_cpu, None)
+        if current is not None and current[0] == prev_pid and prev_pid != 0:
+            entry = task(prev_pid, prev_comm, current[1])
+            entry[2] += ts - current[1]
+            entry[4] = ts
+            if on_segment:
+                on_segment(ev_cpu, entry[0], _ticks(current[1] - t0, tick), _ticks(ts - t0, tick))
+        if next_pid != 0:
+            entry = task(next_pid, next_comm, ts)
+            if entry[3] is None:
+                entry[3] = ts
+            running[ev_cpu] = (next_pid, ts)
+
+    # Close runs that were still on CPU when the trace ended
+    for ev_cpu, (pid, since) in running.items():
+        entry = tasks[pid]
+        entry[2] += t_last - since
+        entry[4] = t_last
+        if on_segment:
+            on_segment(ev_cpu, entry[0], _ticks(since - t0, tick), _ticks(t_last - t0, tick))
+
+    processes, observed = [], {}
+    for name, arrival, runtime, first_run, last_end in tasks.values():
+        if first_run is None:
+            continue  # woken but never ran inside the trace window
+        at = _ticks(arrival - t0, tick)
+        bt = max(1, _ticks(runtime, tick))
+        processes.append((name, at, bt))
+        observed[name] = {
+            "arrival": at,
+            "burst": bt,
+            "first_run": _ticks(first_run - t0, tick),
+            "completion": max(at + bt, _ticks(last_end - t0, tick)),
+        }
+    processes.sort(key=lambda p: p[1])
+    duration = _ticks(t_last - t0, tick) if t0 is not None else 0
+    return TraceWorkload(processes, observed, events, duration)
+
+
+def _ticks(seconds, tick):
+    return int(round(seconds / tick))
+
+
+def score_against_trace(schedule, trace):
+    """
+    Compare a simulated schedule with the observed one from a trace
+    Returns mean absolute TAT/WT/RT error and the mean simulated/observed values
+    """
+    simulated = compute_metrics(schedule, trace.processes)["processes"]
+    observed = trace.observed_metrics()
+    names = [n for n in simulated if n in observed]
+    if not names:
+        return {"processes": 0}
+
+    result = {"processes": len(names)}
+    for key in ("tat", "wt", "rt"):
+        result[f"mae_{key}"] = sum(abs(simulated[n][key] - observed[n][key]) for n in names) / len(names)
+        result[f"sim_avg_{key}"] = sum(simulated[n][key] for n in names) / len(names)
+        result[f"obs_avg_{key}"] = sum(observed[n][key] for n in names) / len(names)
+    return result